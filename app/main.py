@@ -396,12 +396,20 @@ async def connectivity_polling_loop():
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI, tasks: Optional[list[asyncio.Task]] = None):
     """
     Application lifespan manager for startup and shutdown events.
+
+    Args:
+        app: The FastAPI application.
+        tasks: Registry for the background tasks started here, cancelled and
+            cleared on shutdown. Defaults to the module-level _background_tasks.
     """
     global _mongo_store, _network_checker
 
+    if tasks is None:
+        tasks = _background_tasks
+
     # Startup
     logger.info("DailyFour starting up...")
     logger.info("Monitoring Wi-Fi: %s", settings.office_wifi_name)
@@ -455,27 +463,34 @@ async def lifespan(app: FastAPI):
 
     # Start Wi-Fi polling background task
     wifi_task = asyncio.create_task(wifi_polling_loop())
-    _background_tasks.append(wifi_task)
+    tasks.append(wifi_task)
     logger.info("Wi-Fi monitoring started")
 
     # Start timer polling background task
     timer_task = asyncio.create_task(timer_polling_loop())
-    _background_tasks.append(timer_task)
+    tasks.append(timer_task)
     logger.info("Timer engine started")
 
     # Start network connectivity monitoring background task
     connectivity_task = asyncio.create_task(connectivity_polling_loop())
-    _background_tasks.append(connectivity_task)
+    tasks.append(connectivity_task)
     logger.info("Network connectivity monitoring started")
 
     yield
 
     # Shutdown — cancel all background tasks
     logger.info("DailyFour shutting down...")
-    for task in _background_tasks:
+    for task in tasks:
         task.cancel()
-    await asyncio.gather(*_background_tasks, return_exceptions=True)
-    _background_tasks.clear()
+    # return_exceptions keeps one failed loop from aborting the rest of shutdown;
+    # failures other than the cancellation itself are still logged
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for task, result in zip(tasks, results):
+        if isinstance(result, Exception):
+            logger.error(
+                "Background task %s failed: %r", task.get_name(), result, exc_info=result
+            )
+    tasks.clear()
 
     # Cleanup network checker
     if _network_checker:
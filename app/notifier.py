@@ -6,6 +6,7 @@ Uses macOS Notification Center via osascript. Falls back gracefully
 on unsupported platforms or when the subprocess fails.
 """
 
+import asyncio
 import logging
 import platform
 import subprocess
@@ -39,6 +40,22 @@ def can_send_notifications() -> bool:
     return platform.system() == "Darwin"
 
 
+def _build_notification_script(title: str, message: str) -> str:
+    """
+    Build the AppleScript snippet that displays a Notification Center alert.
+
+    Args:
+        title: Raw notification title.
+        message: Raw notification body.
+
+    Returns:
+        AppleScript source with both values safely escaped.
+    """
+    safe_title = _escape_osascript_string(title)
+    safe_message = _escape_osascript_string(message)
+    return f'display notification "{safe_message}" with title "{safe_title}"'
+
+
 def send_notification(title: str, message: str) -> bool:
     """
     Send an OS-level notification to the user.
@@ -60,12 +77,7 @@ def send_notification(title: str, message: str) -> bool:
         )
         return False
 
-    safe_title = _escape_osascript_string(title)
-    safe_message = _escape_osascript_string(message)
-
-    script = (
-        f'display notification "{safe_message}" with title "{safe_title}"'
-    )
+    script = _build_notification_script(title, message)
 
     try:
         result = subprocess.run(
@@ -94,3 +106,63 @@ def send_notification(title: str, message: str) -> bool:
     except OSError as exc:
         logger.warning("OS error sending notification: %s", exc)
         return False
+
+
+async def send_notification_async(title: str, message: str) -> bool:
+    """
+    Send an OS-level notification without blocking the event loop.
+
+    Async counterpart of :func:`send_notification` for use inside
+    background coroutines such as ``timer_polling_loop``. ``osascript``
+    is spawned with ``asyncio.create_subprocess_exec`` so other tasks keep
+    running while Notification Center processes the request. Failure
+    modes are logged and reported exactly like the sync variant.
+
+    Args:
+        title: Notification title (e.g. "Office Wi-Fi Tracker").
+        message: Notification body (e.g. "4 hours + 10 min buffer completed.").
+
+    Returns:
+        True if the notification was delivered successfully, False otherwise.
+    """
+    if not can_send_notifications():
+        logger.warning(
+            "Notifications not supported on %s; skipping", platform.system()
+        )
+        return False
+
+    script = _build_notification_script(title, message)
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "osascript",
+            "-e",
+            script,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        logger.warning("osascript binary not found; notifications unavailable")
+        return False
+    except OSError as exc:
+        logger.warning("OS error sending notification: %s", exc)
+        return False
+
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.warning("Notification timed out after 10 seconds")
+        return False
+
+    if proc.returncode == 0:
+        logger.info("Notification sent: %s — %s", title, message)
+        return True
+
+    logger.warning(
+        "osascript returned non-zero exit code %d: %s",
+        proc.returncode,
+        (stderr or b"").decode(errors="replace").strip(),
+    )
+    return False
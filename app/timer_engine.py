@@ -14,11 +14,12 @@ from datetime import datetime, timedelta, UTC
 from html import escape
 from typing import Any, Optional
 
+from app import wifi_detector
 from app.config import settings
-from app.notifier import send_notification
+from app.notifier import send_notification_async
 from app.email_notifier import send_email_notification
 from app.mongodb_store import MongoDBStore
-from app.timezone_utils import now_utc, format_time_ist
+from app.timezone_utils import now_utc, format_time_ist, get_today_date_ist
 
 logger = logging.getLogger(__name__)
 
@@ -487,6 +488,11 @@ async def timer_polling_loop() -> None:
     interval = _normalize_interval_seconds(settings.timer_check_interval_seconds)
     target_minutes = _resolve_target_minutes()
 
+    # Resolve per-tick collaborators once per loop entry instead of
+    # re-importing and re-looking them up on every poll.
+    get_current_ssid = wifi_detector.get_current_ssid
+    is_office_ssid = wifi_detector.is_office_ssid
+
     logger.info(f"Timer polling started — interval: {interval}s, target: {target_minutes} min")
 
     while True:
@@ -494,8 +500,6 @@ async def timer_polling_loop() -> None:
         try:
             # Hard gate: never run timer math for non-office Wi-Fi.
             # This avoids unnecessary DB operations while away from office.
-            from app.wifi_detector import get_current_ssid, is_office_ssid
-
             current_ssid = get_current_ssid(use_cache=True)
             if not is_office_ssid(current_ssid):
                 logger.debug("Timer check skipped: not on configured office Wi-Fi")
@@ -527,7 +531,6 @@ async def timer_polling_loop() -> None:
             completion_desktop_sent_at = doc.get("completion_desktop_sent_at")
 
             # BUGFIX: Force-close stale sessions from previous days
-            from app.timezone_utils import get_today_date_ist
             today_date = get_today_date_ist()
             if date and date != today_date:
                 logger.warning(
@@ -636,7 +639,7 @@ async def timer_polling_loop() -> None:
                 )
 
                 if completion_desktop_sent_at is None:
-                    desktop_sent = send_notification(
+                    desktop_sent = await send_notification_async(
                         "Office Wi-Fi Tracker",
                         completion_message,
                     )
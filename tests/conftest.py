@@ -1,4 +1,39 @@
-"""Pytest configuration and shared markers."""
+"""Pytest configuration, shared markers and fixtures."""
+
+import functools
+import json
+import os
+import plistlib
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient, Response
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib encoder produces the same rows
+    orjson = None
+
+if orjson is not None:
+    _encode_row: Callable[[dict], bytes] = orjson.dumps
+    _decode: Callable[[bytes], Any] = orjson.loads
+else:
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    _decode = json.loads
+
+    def _encode_row(row: dict) -> bytes:
+        """Encode one fixture row as compact UTF-8 JSON."""
+        return _json_encode(row).encode("utf-8")
+
+
+def _loads(response: Response) -> Any:
+    """Parse a response body as JSON (orjson when installed, else stdlib)."""
+    return _decode(response.content)
 
 
 def pytest_configure(config):
@@ -7,3 +42,236 @@ def pytest_configure(config):
         "markers",
         "mongodb: Tests using MongoDB backend (integration tests)"
     )
+    # Registered here so the marker is known even when pytest-xdist is absent.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): Keep tests on one pytest-xdist worker under --dist=loadgroup"
+    )
+
+
+def _write_log_lines(log_path: Path, lines: list) -> None:
+    """Write fixture rows to ``log_path`` in a single write (dicts as JSON, str verbatim)."""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = b"".join(
+        (line.encode("utf-8") if isinstance(line, str) else _encode_row(line)) + b"\n"
+        for line in lines
+    )
+    fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def plist_bytes() -> bytes:
+    """Raw com.officetracker.plist, read once per session."""
+    return Path("com.officetracker.plist").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def plist_data(plist_bytes: bytes) -> dict[str, Any]:
+    """Parsed com.officetracker.plist, shared by the launchd suites."""
+    return plistlib.loads(plist_bytes)
+
+
+@pytest.fixture(scope="session")
+def install_sh() -> str:
+    """scripts/install-autostart.sh, read once per session."""
+    return Path("scripts/install-autostart.sh").read_text()
+
+
+@pytest.fixture(scope="session")
+def uninstall_sh() -> str:
+    """scripts/uninstall-autostart.sh, read once per session."""
+    return Path("scripts/uninstall-autostart.sh").read_text()
+
+
+@pytest.fixture(scope="session")
+def install_sh_lines(install_sh: str) -> list[str]:
+    """install-autostart.sh split into lines, for ordering checks."""
+    return install_sh.split("\n")
+
+
+@pytest.fixture(scope="session")
+def uninstall_sh_lines(uninstall_sh: str) -> list[str]:
+    """uninstall-autostart.sh split into lines, for ordering checks."""
+    return uninstall_sh.split("\n")
+
+
+@pytest.fixture(scope="session")
+def path_stat() -> Callable[[str], Optional[os.stat_result]]:
+    """
+    Return a session-cached ``os.stat`` lookup for repo and plist paths.
+
+    One stat call answers exists / file-vs-dir / mode checks together;
+    missing paths yield None instead of raising.
+    """
+
+    @functools.cache
+    def lookup(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    return lookup
+
+
+@pytest.fixture
+def load_json() -> Callable[[Response], Any]:
+    """Return the shared response JSON decoder."""
+    return _loads
+
+
+@pytest.fixture
+def stub_read_sessions(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """
+    Return an installer replacing ``app.analytics.read_sessions`` with a plain stub.
+
+    The stub returns ``result`` for every day (raising it if it is an exception),
+    or, with ``by_day``, looks rows up by ``(year, month, day)`` and returns
+    ``[]`` for days not in the table.
+    """
+    from app import analytics
+
+    def install(
+        result: Any = (),
+        *,
+        by_day: Optional[dict[tuple[int, int, int], Any]] = None,
+    ) -> None:
+        def fake_read_sessions(day: datetime) -> Any:
+            if by_day is not None:
+                return by_day.get((day.year, day.month, day.day), [])
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        monkeypatch.setattr(analytics, "read_sessions", fake_read_sessions)
+
+    return install
+
+
+@pytest.fixture
+def freeze_analytics_now(monkeypatch: pytest.MonkeyPatch) -> Callable[[datetime], None]:
+    """
+    Return an installer pinning ``datetime.now()`` inside ``app.analytics``.
+
+    Only ``now`` is overridden, so ``strptime`` and arithmetic stay the real
+    ``datetime`` ones.
+    """
+    from app import analytics
+
+    def install(fixed_now: datetime) -> None:
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls):
+                return fixed_now
+
+        monkeypatch.setattr(analytics, "datetime", _FrozenDatetime)
+
+    return install
+
+
+@pytest.fixture
+def lifespan_env():
+    """
+    Stub every external dependency of ``app.main.lifespan`` for one test.
+
+    MongoDB, the connectivity checker, session recovery and the SSID probe are
+    replaced, and the ``_mongo_store``/``_network_checker`` globals lifespan
+    assigns are restored afterwards; yields the polling loop mocks so tests can
+    assert on them or give them a ``side_effect``.
+    """
+    from app.mongodb_store import MongoDBStore
+    from app.network_checker import NetworkConnectivityChecker
+    from app.session_manager import SessionManager
+
+    loops = {"wifi_polling_loop": AsyncMock(), "timer_polling_loop": AsyncMock()}
+    with patch.multiple(
+             "app.main",
+             get_current_ssid=lambda use_cache=False: None,
+             _mongo_store=None,
+             _network_checker=None,
+             **loops,
+         ), \
+         patch.multiple(
+             MongoDBStore,
+             connect=AsyncMock(),
+             close_stale_sessions=AsyncMock(return_value=0),
+             disconnect=AsyncMock(),
+         ), \
+         patch.multiple(NetworkConnectivityChecker, initialize=AsyncMock(), cleanup=AsyncMock()), \
+         patch.object(SessionManager, "recover_session", AsyncMock(return_value=False)):
+        yield SimpleNamespace(**loops)
+
+
+@pytest.fixture
+def write_log_lines() -> Callable[[Path, list], None]:
+    """Return the shared JSON Lines fixture writer used by the file store suites."""
+    return _write_log_lines
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    One AsyncClient bound to the FastAPI app for the whole test session.
+
+    Modules using it must run on the session event loop, i.e. declare
+    ``pytestmark = pytest.mark.asyncio(loop_scope="session")``.
+    """
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def sync_client():
+    """
+    Blocking TestClient for tests that make plain sequential GETs.
+
+    Not entered as a context manager, so the app lifespan (MongoDB and the
+    polling loops) never starts.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def js_text(sync_client) -> str:
+    """Body of /static/app.js, fetched once per session."""
+    response = sync_client.get("/static/app.js")
+    assert response.status_code == 200
+    return response.text
+
+
+@pytest.fixture(scope="session")
+def dashboard_html(sync_client) -> str:
+    """
+    Dashboard HTML rendered once per session under default settings.
+
+    Tests that patch settings to change the rendered output must request
+    ``/`` themselves instead of using this fixture.
+    """
+    response = sync_client.get("/")
+    assert response.status_code == 200
+    return response.text
+
+
+@pytest.fixture(scope="session")
+def default_payloads(sync_client) -> dict[str, dict[str, Any]]:
+    """
+    Parsed /api/status and /api/today bodies in the default (no session) state.
+
+    Both endpoints are fetched once per session.
+    """
+    status = sync_client.get("/api/status")
+    today = sync_client.get("/api/today")
+
+    assert status.status_code == 200
+    assert today.status_code == 200
+    return {"status": _loads(status), "today": _loads(today)}
@@ -3,16 +3,21 @@ Regression tests for edit-start-time notification flag reset behavior.
 """
 
 from datetime import datetime, UTC
+from typing import Any, Callable
 from unittest.mock import AsyncMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient, Response
 
 import app.main as main
 
 
-@pytest.mark.asyncio
-async def test_edit_start_time_resets_notification_flags(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_edit_start_time_resets_notification_flags(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+    load_json: Callable[[Response], Any],
+) -> None:
     """Successful start-time edit must reset daily notification sent flags."""
     mock_store = AsyncMock()
     mock_store.get_daily_status.return_value = {
@@ -32,13 +37,9 @@ async def test_edit_start_time_resets_notification_flags(monkeypatch: pytest.Mon
         "new_start_time_ist": "10:00 AM",
     }
 
-    async with AsyncClient(
-        transport=ASGITransport(app=main.app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/session/edit-start-time", json=payload)
+    response = await client.post("/api/session/edit-start-time", json=payload)
 
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert data["success"] is True
     mock_store.reset_notification_flags.assert_awaited_once_with("07-03-2026")
@@ -4,7 +4,7 @@ Tests for Phase 1.1: SSID Detection for macOS.
 Verifies that get_current_ssid() and its internal methods work correctly.
 """
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, MagicMock, patch
 import subprocess
 
 from app.wifi_detector import (
@@ -111,24 +111,30 @@ def test_system_profiler_timeout():
 
 def test_get_current_ssid_uses_networksetup_first():
     """Uses networksetup when it succeeds."""
-    with patch("app.wifi_detector._get_ssid_via_networksetup", return_value="FastWifi"):
-        with patch("app.wifi_detector._get_ssid_via_system_profiler") as fallback:
-            assert get_current_ssid() == "FastWifi"
-            fallback.assert_not_called()
+    with patch.multiple(
+        "app.wifi_detector",
+        _get_ssid_via_networksetup=MagicMock(return_value="FastWifi"),
+        _get_ssid_via_system_profiler=DEFAULT,
+    ) as mocks:
+        assert get_current_ssid() == "FastWifi"
+        mocks["_get_ssid_via_system_profiler"].assert_not_called()
 
 
 def test_get_current_ssid_falls_back_to_system_profiler():
     """Falls back to system_profiler when networksetup returns None."""
-    with patch("app.wifi_detector._get_ssid_via_networksetup", return_value=None):
-        with patch(
-            "app.wifi_detector._get_ssid_via_system_profiler",
-            return_value="SlowWifi",
-        ):
-            assert get_current_ssid() == "SlowWifi"
+    with patch.multiple(
+        "app.wifi_detector",
+        _get_ssid_via_networksetup=MagicMock(return_value=None),
+        _get_ssid_via_system_profiler=MagicMock(return_value="SlowWifi"),
+    ):
+        assert get_current_ssid() == "SlowWifi"
 
 
 def test_get_current_ssid_returns_none_when_both_fail():
     """Returns None when both methods fail."""
-    with patch("app.wifi_detector._get_ssid_via_networksetup", return_value=None):
-        with patch("app.wifi_detector._get_ssid_via_system_profiler", return_value=None):
-            assert get_current_ssid() is None
+    with patch.multiple(
+        "app.wifi_detector",
+        _get_ssid_via_networksetup=MagicMock(return_value=None),
+        _get_ssid_via_system_profiler=MagicMock(return_value=None),
+    ):
+        assert get_current_ssid() is None
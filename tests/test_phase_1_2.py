@@ -6,98 +6,131 @@ and handles errors without crashing.
 """
 
 import asyncio
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from typing import Callable, Optional
 
 import pytest
 
+import app.wifi_detector as wifi_detector
 from app.wifi_detector import wifi_polling_loop
 
 
-@pytest.fixture(autouse=True)
+# Settings read by wifi_polling_loop; never mutated, so one instance serves every test.
+_FAST_SETTINGS = SimpleNamespace(wifi_check_interval_seconds=0.01, office_wifi_name="OfficeWifi")
+
+
+@pytest.fixture(scope="module", autouse=True)
 def _fast_polling():
-    """Override polling interval to 0.1s for fast tests."""
-    with patch("app.wifi_detector.settings") as mock_settings:
-        mock_settings.wifi_check_interval_seconds = 0.1
+    """Override polling interval to 0.01s and run without a SessionManager."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(wifi_detector, "settings", _FAST_SETTINGS)
+        mp.setattr(wifi_detector, "get_session_manager", lambda: None)
         yield
 
 
-@pytest.mark.asyncio
-async def test_polling_loop_detects_initial_ssid():
-    """Loop starts and captures initial SSID."""
-    with patch("app.wifi_detector.get_current_ssid", return_value="OfficeWifi"):
-        task = asyncio.create_task(wifi_polling_loop())
-        await asyncio.sleep(0.05)  # let it capture initial state
+def _ssid_source(
+    monkeypatch: pytest.MonkeyPatch,
+    values: Callable[[int], Optional[str]],
+    *,
+    done_after: int,
+) -> tuple[asyncio.Event, list[int]]:
+    """
+    Install a fake get_current_ssid that signals once it has been polled enough.
+
+    Args:
+        values: Maps the 1-based call number to the SSID to return (may raise).
+        done_after: Call number after which the returned event is set.
+
+    Returns:
+        The completion event and a single-item list holding the call count.
+    """
+    done = asyncio.Event()
+    calls = [0]
+
+    def fake_ssid() -> Optional[str]:
+        calls[0] += 1
+        if calls[0] >= done_after:
+            done.set()
+        return values(calls[0])
+
+    monkeypatch.setattr(wifi_detector, "get_current_ssid", fake_ssid)
+    return done, calls
+
+
+async def _run_loop_until(event: asyncio.Event, *, max_wait: float = 1.0, **loop_kwargs) -> None:
+    """Run wifi_polling_loop until ``event`` is set, then cancel it."""
+    task = asyncio.create_task(wifi_polling_loop(**loop_kwargs))
+    try:
+        await asyncio.wait_for(event.wait(), max_wait)
+    finally:
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
 
 
 @pytest.mark.asyncio
-async def test_polling_loop_calls_on_change():
+async def test_polling_loop_detects_initial_ssid(monkeypatch: pytest.MonkeyPatch):
+    """Loop starts and captures initial SSID."""
+    done, calls = _ssid_source(monkeypatch, lambda n: "OfficeWifi", done_after=1)
+
+    await _run_loop_until(done)
+
+    assert calls[0] >= 1
+
+
+@pytest.mark.asyncio
+async def test_polling_loop_calls_on_change(monkeypatch: pytest.MonkeyPatch):
     """Calls on_change callback when SSID changes."""
-    # First call is initial capture, second is the poll that sees a change
-    ssid_sequence = iter(["OfficeWifi", "HomeWifi"])
+    # First call is initial capture, later polls see the change
     changes = []
+    changed = asyncio.Event()
 
     def on_change(old, new):
         changes.append((old, new))
+        changed.set()
 
-    with patch("app.wifi_detector.get_current_ssid", side_effect=lambda: next(ssid_sequence, "HomeWifi")):
-        task = asyncio.create_task(wifi_polling_loop(on_change=on_change))
-        await asyncio.sleep(0.3)  # enough for initial + at least 1 poll
-        task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await task
+    _ssid_source(
+        monkeypatch, lambda n: "OfficeWifi" if n == 1 else "HomeWifi", done_after=2
+    )
+
+    await _run_loop_until(changed, on_change=on_change)
 
     assert len(changes) == 1
     assert changes[0] == ("OfficeWifi", "HomeWifi")
 
 
 @pytest.mark.asyncio
-async def test_polling_loop_no_callback_when_unchanged():
+async def test_polling_loop_no_callback_when_unchanged(monkeypatch: pytest.MonkeyPatch):
     """Does not call on_change when SSID stays the same."""
     changes = []
+    done, _calls = _ssid_source(monkeypatch, lambda n: "OfficeWifi", done_after=4)
 
-    with patch("app.wifi_detector.get_current_ssid", return_value="OfficeWifi"):
-        task = asyncio.create_task(wifi_polling_loop(on_change=lambda o, n: changes.append((o, n))))
-        await asyncio.sleep(0.3)  # several polls
-        task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await task
+    await _run_loop_until(done, on_change=lambda o, n: changes.append((o, n)))
 
     assert changes == []
 
 
 @pytest.mark.asyncio
-async def test_polling_loop_survives_exception():
+async def test_polling_loop_survives_exception(monkeypatch: pytest.MonkeyPatch):
     """Loop continues running even if get_current_ssid raises."""
-    call_count = 0
 
-    def flaky_ssid():
-        nonlocal call_count
-        call_count += 1
-        if call_count == 2:
+    def flaky_ssid(call_number: int) -> str:
+        if call_number == 2:
             raise RuntimeError("Simulated failure")
         return "OfficeWifi"
 
-    with patch("app.wifi_detector.get_current_ssid", side_effect=flaky_ssid):
-        task = asyncio.create_task(wifi_polling_loop())
-        await asyncio.sleep(0.5)  # enough for several polls
-        task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await task
+    done, calls = _ssid_source(monkeypatch, flaky_ssid, done_after=3)
+
+    await _run_loop_until(done)
 
     # Should have been called more than 2 times (loop didn't die at call 2)
-    assert call_count >= 3
+    assert calls[0] >= 3
 
 
 @pytest.mark.asyncio
-async def test_polling_loop_cancels_cleanly():
+async def test_polling_loop_cancels_cleanly(monkeypatch: pytest.MonkeyPatch):
     """Task can be cancelled without errors."""
-    with patch("app.wifi_detector.get_current_ssid", return_value="OfficeWifi"):
-        task = asyncio.create_task(wifi_polling_loop())
-        await asyncio.sleep(0.15)
-        task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await task
+    done, _calls = _ssid_source(monkeypatch, lambda n: "OfficeWifi", done_after=2)
+
+    await _run_loop_until(done)
     # If we get here, no unexpected exceptions were raised
@@ -11,26 +11,26 @@ Covers:
 
 import json
 import os
-import tempfile
 import threading
 from datetime import datetime
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 
+import app.file_store as file_store
 from app.cache import invalidate_cache
 from app.file_store import get_log_path, append_session, read_sessions
 
+pytestmark = pytest.mark.xdist_group(name="file_store")
+
 
 @pytest.fixture(autouse=True)
-def _tmp_data_dir():
+def _tmp_data_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
     """Redirect all file_store operations to a temp directory and clear cache."""
     # Clear cache before each test
     invalidate_cache()
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with patch("app.file_store.settings") as mock_settings:
-            mock_settings.data_dir = tmpdir
-            yield tmpdir
+    monkeypatch.setattr(file_store, "settings", SimpleNamespace(data_dir=str(tmp_path)))
+    yield str(tmp_path)
     # Clear cache after each test
     invalidate_cache()
 
@@ -91,11 +91,12 @@ def test_append_multiple_sessions(_tmp_data_dir):
     assert json.loads(lines[1]) == s2
 
 
-def test_append_returns_false_on_write_error():
+def test_append_returns_false_on_write_error(monkeypatch: pytest.MonkeyPatch):
     """Returns False when the directory is not writable."""
-    with patch("app.file_store.settings") as mock_settings:
-        mock_settings.data_dir = "/nonexistent/readonly/path"
-        result = append_session({"ssid": "test"})
+    monkeypatch.setattr(
+        file_store, "settings", SimpleNamespace(data_dir="/nonexistent/readonly/path")
+    )
+    result = append_session({"ssid": "test"})
     assert result is False
 
 
@@ -127,14 +128,9 @@ def test_read_returns_empty_for_empty_file(_tmp_data_dir):
     assert read_sessions() == []
 
 
-def test_read_skips_corrupted_lines(_tmp_data_dir):
+def test_read_skips_corrupted_lines(_tmp_data_dir, write_log_lines):
     """Corrupted lines are skipped; valid lines still returned."""
-    log_path = get_log_path()
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "w") as f:
-        f.write('{"ssid": "Good"}\n')
-        f.write("THIS IS NOT JSON\n")
-        f.write('{"ssid": "AlsoGood"}\n')
+    write_log_lines(get_log_path(), [{"ssid": "Good"}, "THIS IS NOT JSON", {"ssid": "AlsoGood"}])
 
     sessions = read_sessions()
     assert len(sessions) == 2
@@ -142,27 +138,18 @@ def test_read_skips_corrupted_lines(_tmp_data_dir):
     assert sessions[1]["ssid"] == "AlsoGood"
 
 
-def test_read_skips_blank_lines(_tmp_data_dir):
+def test_read_skips_blank_lines(_tmp_data_dir, write_log_lines):
     """Blank lines are silently skipped."""
-    log_path = get_log_path()
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "w") as f:
-        f.write('{"ssid": "A"}\n')
-        f.write("\n")
-        f.write("   \n")
-        f.write('{"ssid": "B"}\n')
+    write_log_lines(get_log_path(), [{"ssid": "A"}, "", "   ", {"ssid": "B"}])
 
     sessions = read_sessions()
     assert len(sessions) == 2
 
 
-def test_read_for_specific_date(_tmp_data_dir):
+def test_read_for_specific_date(_tmp_data_dir, write_log_lines):
     """Can read sessions for a specific past date."""
     target = datetime(2026, 1, 15)
-    log_path = get_log_path(target)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "w") as f:
-        f.write('{"ssid": "OldSession"}\n')
+    write_log_lines(get_log_path(target), [{"ssid": "OldSession"}])
 
     sessions = read_sessions(target)
     assert len(sessions) == 1
@@ -10,35 +10,35 @@ Covers:
 """
 
 import json
-import os
-import tempfile
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
+import app.file_store as file_store
 from app.file_store import append_session, get_log_path, read_sessions
 
+pytestmark = pytest.mark.xdist_group(name="file_store")
+
 
 @pytest.fixture(autouse=True)
-def _tmp_store_paths():
+def _tmp_store_paths(tmp_path, monkeypatch: pytest.MonkeyPatch):
     """Use isolated temp data/archive directories for each test."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = os.path.join(tmpdir, "data")
-        archive_dir = os.path.join(tmpdir, "archive")
-        with patch("app.file_store.settings") as mock_settings:
-            mock_settings.data_dir = data_dir
-            mock_settings.archive_dir = archive_dir
-            yield Path(data_dir), Path(archive_dir)
+    data_dir = tmp_path / "data"
+    archive_dir = tmp_path / "archive"
+    monkeypatch.setattr(
+        file_store,
+        "settings",
+        SimpleNamespace(data_dir=str(data_dir), archive_dir=str(archive_dir)),
+    )
+    yield data_dir, archive_dir
 
 
-def test_rotation_moves_base_file_and_writes_to_part2(_tmp_store_paths) -> None:
+def test_rotation_moves_base_file_and_writes_to_part2(_tmp_store_paths, write_log_lines) -> None:
     """When base file exceeds threshold, it is archived and part2 receives new data."""
     data_dir, archive_dir = _tmp_store_paths
     base_path = get_log_path()
-    base_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(base_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "Old"}) + "\n")
+    write_log_lines(base_path, [{"ssid": "Old"}])
 
     with patch("app.file_store.MAX_LOG_FILE_SIZE_BYTES", 1):
         ok = append_session({"ssid": "New"})
@@ -53,13 +53,11 @@ def test_rotation_moves_base_file_and_writes_to_part2(_tmp_store_paths) -> None:
     assert written["ssid"] == "New"
 
 
-def test_rotation_supports_multiple_part_files(_tmp_store_paths) -> None:
+def test_rotation_supports_multiple_part_files(_tmp_store_paths, write_log_lines) -> None:
     """Oversized part2 is rotated to archive and next write goes to part3."""
     _data_dir, archive_dir = _tmp_store_paths
     base_path = get_log_path()
-    base_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(base_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "A"}) + "\n")
+    write_log_lines(base_path, [{"ssid": "A"}])
 
     with patch("app.file_store.MAX_LOG_FILE_SIZE_BYTES", 1):
         assert append_session({"ssid": "B"}) is True
@@ -92,14 +90,12 @@ def test_rotation_is_not_triggered_when_size_equals_threshold(_tmp_store_paths)
 
 def test_read_sessions_preserves_data_across_archive_and_parts(
     _tmp_store_paths,
+    write_log_lines,
 ) -> None:
     """Read should include archived and active part files while skipping corrupted lines."""
     _data_dir, _archive_dir = _tmp_store_paths
     base_path = get_log_path()
-    base_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(base_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "First"}) + "\n")
-        f.write("CORRUPTED_LINE\n")
+    write_log_lines(base_path, [{"ssid": "First"}, "CORRUPTED_LINE"])
 
     with patch("app.file_store.MAX_LOG_FILE_SIZE_BYTES", 1):
         assert append_session({"ssid": "Second"}) is True
@@ -110,13 +106,11 @@ def test_read_sessions_preserves_data_across_archive_and_parts(
     assert sessions[1]["ssid"] == "Second"
 
 
-def test_rotation_creates_archive_directory_if_missing(_tmp_store_paths) -> None:
+def test_rotation_creates_archive_directory_if_missing(_tmp_store_paths, write_log_lines) -> None:
     """Archive directory is created automatically during rotation."""
     _data_dir, archive_dir = _tmp_store_paths
     base_path = get_log_path()
-    base_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(base_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "Old"}) + "\n")
+    write_log_lines(base_path, [{"ssid": "Old"}])
 
     assert not archive_dir.exists()
     with patch("app.file_store.MAX_LOG_FILE_SIZE_BYTES", 1):
@@ -125,13 +119,11 @@ def test_rotation_creates_archive_directory_if_missing(_tmp_store_paths) -> None
     assert archive_dir.exists()
 
 
-def test_append_returns_false_when_rotation_move_fails(_tmp_store_paths) -> None:
+def test_append_returns_false_when_rotation_move_fails(_tmp_store_paths, write_log_lines) -> None:
     """If archive move fails during rotation, append_session returns False safely."""
     _data_dir, _archive_dir = _tmp_store_paths
     base_path = get_log_path()
-    base_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(base_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "Old"}) + "\n")
+    write_log_lines(base_path, [{"ssid": "Old"}])
 
     with patch("app.file_store.MAX_LOG_FILE_SIZE_BYTES", 1):
         with patch("app.file_store.shutil.move", side_effect=OSError("move failed")):
@@ -144,18 +136,15 @@ def test_append_returns_false_when_rotation_move_fails(_tmp_store_paths) -> None
 
 def test_read_sessions_includes_collision_named_archived_files(
     _tmp_store_paths,
+    write_log_lines,
 ) -> None:
     """Read should include archived files with collision suffix names."""
     _data_dir, archive_dir = _tmp_store_paths
-    archive_dir.mkdir(parents=True, exist_ok=True)
     collision_base = archive_dir / f"{get_log_path().stem}_1.log"
-    with open(collision_base, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "ArchivedBaseCollision"}) + "\n")
+    write_log_lines(collision_base, [{"ssid": "ArchivedBaseCollision"}])
 
     active_path = get_log_path(part=2)
-    active_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(active_path, "w", encoding="utf-8") as f:
-        f.write(json.dumps({"ssid": "ActivePart"}) + "\n")
+    write_log_lines(active_path, [{"ssid": "ActivePart"}])
 
     sessions = read_sessions()
     assert [s["ssid"] for s in sessions] == ["ArchivedBaseCollision", "ActivePart"]
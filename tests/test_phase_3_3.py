@@ -10,13 +10,24 @@ Covers:
 - Integration: timer loop sends correct message format
 """
 
+import asyncio
 import logging
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.notifier import _escape_osascript_string, can_send_notifications, send_notification
+from app.notifier import (
+    _escape_osascript_string,
+    can_send_notifications,
+    send_notification,
+    send_notification_async,
+)
+
+
+def _logged(caplog: pytest.LogCaptureFixture, text: str) -> bool:
+    """Return True if any captured record's raw message contains ``text``."""
+    return any(text in record.getMessage() for record in caplog.records)
 
 
 # --- can_send_notifications ---
@@ -38,32 +49,19 @@ def test_cannot_send_on_non_macos(os_name: str) -> None:
 # --- _escape_osascript_string ---
 
 
-def test_escape_plain_string() -> None:
-    """Plain strings are returned unchanged."""
-    assert _escape_osascript_string("hello world") == "hello world"
-
-
-def test_escape_double_quotes() -> None:
-    """Double quotes are backslash-escaped."""
-    assert _escape_osascript_string('say "hi"') == 'say \\"hi\\"'
-
-
-def test_escape_backslashes() -> None:
-    """Backslashes are double-escaped."""
-    assert _escape_osascript_string("path\\to\\file") == "path\\\\to\\\\file"
-
-
-def test_escape_mixed_special_chars() -> None:
-    """Both backslashes and double quotes are handled together."""
-    assert (
-        _escape_osascript_string('a\\b "c"')
-        == 'a\\\\b \\"c\\"'
-    )
-
-
-def test_escape_empty_string() -> None:
-    """Empty string is returned unchanged."""
-    assert _escape_osascript_string("") == ""
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        pytest.param("hello world", "hello world", id="plain"),
+        pytest.param('say "hi"', 'say \\"hi\\"', id="double-quotes"),
+        pytest.param("path\\to\\file", "path\\\\to\\\\file", id="backslashes"),
+        pytest.param('a\\b "c"', 'a\\\\b \\"c\\"', id="mixed"),
+        pytest.param("", "", id="empty"),
+    ],
+)
+def test_escape_osascript_string(raw: str, expected: str) -> None:
+    """Backslashes are doubled and double quotes backslash-escaped; nothing else changes."""
+    assert _escape_osascript_string(raw) == expected
 
 
 # --- send_notification: happy path ---
@@ -89,16 +87,16 @@ def test_send_notification_success() -> None:
 
 def test_send_notification_logs_success(caplog: pytest.LogCaptureFixture) -> None:
     """Successful send logs an info message with title and body."""
-    caplog.set_level(logging.INFO, logger="app.notifier")
     mock_result = MagicMock()
     mock_result.returncode = 0
 
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch("app.notifier.subprocess.run", return_value=mock_result):
-            send_notification("Title", "Body")
+    with caplog.at_level(logging.INFO, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=True):
+            with patch("app.notifier.subprocess.run", return_value=mock_result):
+                send_notification("Title", "Body")
 
-    assert "Notification sent" in caplog.text
-    assert "Title" in caplog.text
+    assert _logged(caplog, "Notification sent")
+    assert _logged(caplog, "Title")
 
 
 # --- send_notification: non-macOS platform ---
@@ -118,166 +116,74 @@ def test_send_notification_logs_warning_on_unsupported_platform(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Logs a warning when platform is unsupported."""
-    caplog.set_level(logging.WARNING, logger="app.notifier")
-    with patch("app.notifier.can_send_notifications", return_value=False):
-        send_notification("T", "M")
-
-    assert "not supported" in caplog.text
-
-
-# --- send_notification: osascript failures ---
-
-
-def test_send_notification_non_zero_exit_code() -> None:
-    """Non-zero osascript exit code returns False."""
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stderr = "some error"
-
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch("app.notifier.subprocess.run", return_value=mock_result):
-            result = send_notification("T", "M")
-
-    assert result is False
-
-
-def test_send_notification_non_zero_logs_warning(
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Non-zero exit code logs the stderr output."""
-    caplog.set_level(logging.WARNING, logger="app.notifier")
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stderr = "osascript error detail"
-
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch("app.notifier.subprocess.run", return_value=mock_result):
+    with caplog.at_level(logging.WARNING, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=False):
             send_notification("T", "M")
 
-    assert "non-zero exit code" in caplog.text
-
-
-def test_send_notification_timeout() -> None:
-    """Timeout during osascript returns False without crashing."""
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=subprocess.TimeoutExpired(cmd="osascript", timeout=10),
-        ):
-            result = send_notification("T", "M")
-
-    assert result is False
+    assert _logged(caplog, "not supported")
 
 
-def test_send_notification_timeout_logs_warning(
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Timeout logs a descriptive warning."""
-    caplog.set_level(logging.WARNING, logger="app.notifier")
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=subprocess.TimeoutExpired(cmd="osascript", timeout=10),
-        ):
-            send_notification("T", "M")
-
-    assert "timed out" in caplog.text
-
-
-def test_send_notification_file_not_found() -> None:
-    """Missing osascript binary returns False without crashing."""
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=FileNotFoundError("osascript"),
-        ):
-            result = send_notification("T", "M")
-
-    assert result is False
+# --- send_notification: osascript failures ---
 
 
-def test_send_notification_file_not_found_logs_warning(
+def _non_zero_result() -> MagicMock:
+    """Build a completed-process stand-in with a failing exit code."""
+    result = MagicMock()
+    result.returncode = 1
+    result.stderr = "osascript error detail"
+    return result
+
+
+@pytest.mark.parametrize(
+    "run_kwargs, expected_log",
+    [
+        ({"return_value": _non_zero_result()}, "non-zero exit code"),
+        (
+            {"side_effect": subprocess.TimeoutExpired(cmd="osascript", timeout=10)},
+            "timed out",
+        ),
+        ({"side_effect": FileNotFoundError("osascript")}, "not found"),
+        ({"side_effect": OSError("permission denied")}, "OS error"),
+    ],
+    ids=["non_zero_exit", "timeout", "file_not_found", "os_error"],
+)
+def test_send_notification_failure_returns_false_and_logs_warning(
+    run_kwargs: dict,
+    expected_log: str,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Missing binary logs a warning about unavailability."""
-    caplog.set_level(logging.WARNING, logger="app.notifier")
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=FileNotFoundError("osascript"),
-        ):
-            send_notification("T", "M")
-
-    assert "not found" in caplog.text
-
-
-def test_send_notification_os_error() -> None:
-    """Generic OSError returns False without crashing."""
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=OSError("permission denied"),
-        ):
-            result = send_notification("T", "M")
+    """osascript failures return False without crashing and log a descriptive warning."""
+    with caplog.at_level(logging.WARNING, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=True):
+            with patch("app.notifier.subprocess.run", **run_kwargs):
+                result = send_notification("T", "M")
 
     assert result is False
-
-
-def test_send_notification_os_error_logs_warning(
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """OSError logs the error detail."""
-    caplog.set_level(logging.WARNING, logger="app.notifier")
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch(
-            "app.notifier.subprocess.run",
-            side_effect=OSError("permission denied"),
-        ):
-            send_notification("T", "M")
-
-    assert "OS error" in caplog.text
+    assert _logged(caplog, expected_log)
 
 
 # --- String escaping integration ---
 
 
-def test_send_notification_escapes_quotes_in_title() -> None:
-    """Double quotes in title are escaped before passing to osascript."""
+@pytest.mark.parametrize(
+    "title, message, escaped",
+    [
+        pytest.param('Title with "quotes"', "Body", '\\"quotes\\"', id="quotes-in-title"),
+        pytest.param("Title", 'Say "hello" to the team', '\\"hello\\"', id="quotes-in-message"),
+        pytest.param("Title", "path\\to\\file", "path\\\\to\\\\file", id="backslashes"),
+    ],
+)
+def test_send_notification_escapes_special_chars(title: str, message: str, escaped: str) -> None:
+    """Quotes and backslashes in title/message are escaped before passing to osascript."""
     mock_result = MagicMock()
     mock_result.returncode = 0
 
     with patch("app.notifier.can_send_notifications", return_value=True):
         with patch("app.notifier.subprocess.run", return_value=mock_result) as mock_run:
-            send_notification('Title with "quotes"', "Body")
+            send_notification(title, message)
 
     script_arg = mock_run.call_args[0][0][2]
-    assert '\\"quotes\\"' in script_arg
-
-
-def test_send_notification_escapes_quotes_in_message() -> None:
-    """Double quotes in message are escaped before passing to osascript."""
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch("app.notifier.subprocess.run", return_value=mock_result) as mock_run:
-            send_notification("Title", 'Say "hello" to the team')
-
-    script_arg = mock_run.call_args[0][0][2]
-    assert '\\"hello\\"' in script_arg
-
-
-def test_send_notification_escapes_backslashes() -> None:
-    """Backslashes in message are escaped before passing to osascript."""
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-
-    with patch("app.notifier.can_send_notifications", return_value=True):
-        with patch("app.notifier.subprocess.run", return_value=mock_result) as mock_run:
-            send_notification("Title", "path\\to\\file")
-
-    script_arg = mock_run.call_args[0][0][2]
-    assert "path\\\\to\\\\file" in script_arg
+    assert escaped in script_arg
 
 
 # --- osascript command format ---
@@ -316,6 +222,115 @@ def test_send_notification_subprocess_called_with_correct_kwargs() -> None:
     assert kwargs["timeout"] == 10
 
 
+# --- send_notification_async ---
+
+
+def _fake_process(returncode: int = 0, stderr: bytes = b"") -> MagicMock:
+    """Build a stand-in for an ``asyncio.subprocess.Process``."""
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.communicate = AsyncMock(return_value=(None, stderr))
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+@pytest.mark.asyncio
+async def test_send_notification_async_success() -> None:
+    """Successful async osascript execution returns True with the same script."""
+    proc = _fake_process(returncode=0)
+
+    with patch("app.notifier.can_send_notifications", return_value=True):
+        with patch(
+            "app.notifier.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=proc),
+        ) as mock_exec:
+            result = await send_notification_async("Office Wi-Fi Tracker", 'Say "hi"')
+
+    assert result is True
+    args = mock_exec.call_args[0]
+    assert args[0] == "osascript"
+    assert args[1] == "-e"
+    assert args[2] == 'display notification "Say \\"hi\\"" with title "Office Wi-Fi Tracker"'
+
+
+@pytest.mark.asyncio
+async def test_send_notification_async_returns_false_on_unsupported_platform() -> None:
+    """Returns False without spawning a subprocess on non-macOS."""
+    with patch("app.notifier.can_send_notifications", return_value=False):
+        with patch("app.notifier.asyncio.create_subprocess_exec") as mock_exec:
+            result = await send_notification_async("T", "M")
+
+    assert result is False
+    mock_exec.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_notification_async_non_zero_exit_code(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Non-zero exit code returns False and logs the decoded stderr."""
+    proc = _fake_process(returncode=1, stderr=b"osascript error detail")
+
+    with caplog.at_level(logging.WARNING, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=True):
+            with patch(
+                "app.notifier.asyncio.create_subprocess_exec",
+                AsyncMock(return_value=proc),
+            ):
+                result = await send_notification_async("T", "M")
+
+    assert result is False
+    assert _logged(caplog, "non-zero exit code")
+    assert _logged(caplog, "osascript error detail")
+
+
+@pytest.mark.asyncio
+async def test_send_notification_async_timeout_kills_process(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Timeout kills the osascript process and returns False."""
+    proc = _fake_process(returncode=0)
+    proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
+
+    with caplog.at_level(logging.WARNING, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=True):
+            with patch(
+                "app.notifier.asyncio.create_subprocess_exec",
+                AsyncMock(return_value=proc),
+            ):
+                result = await send_notification_async("T", "M")
+
+    assert result is False
+    proc.kill.assert_called_once()
+    assert _logged(caplog, "timed out")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error, expected_log",
+    [
+        (FileNotFoundError("osascript"), "not found"),
+        (OSError("permission denied"), "OS error"),
+    ],
+)
+async def test_send_notification_async_spawn_errors(
+    error: Exception,
+    expected_log: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Spawn failures return False and log the same warnings as the sync API."""
+    with caplog.at_level(logging.WARNING, logger="app.notifier"):
+        with patch("app.notifier.can_send_notifications", return_value=True):
+            with patch(
+                "app.notifier.asyncio.create_subprocess_exec",
+                AsyncMock(side_effect=error),
+            ):
+                result = await send_notification_async("T", "M")
+
+    assert result is False
+    assert _logged(caplog, expected_log)
+
+
 # --- Integration: message format from timer loop ---
 
 
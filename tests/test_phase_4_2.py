@@ -8,19 +8,16 @@ Covers:
 """
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi.testclient import TestClient
 
 from app.config import settings
-from app.main import app
 
+pytestmark = pytest.mark.xdist_group(name="dashboard")
 
-@pytest.mark.asyncio
-async def test_root_renders_dashboard_template() -> None:
+
+def test_root_renders_dashboard_template(sync_client: TestClient) -> None:
     """Root endpoint should render the dashboard template HTML."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
+    response = sync_client.get("/")
 
     assert response.status_code == 200
     assert "text/html" in response.headers.get("content-type", "")
@@ -28,77 +25,57 @@ async def test_root_renders_dashboard_template() -> None:
     assert "ThreeFour" in response.text
 
 
-@pytest.mark.asyncio
-async def test_root_includes_required_dashboard_sections() -> None:
-    """Template includes timer, progress, status, sessions table, and total summary."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
+_DASHBOARD_SECTION_NEEDLES = (
+    'id="connection-status"',
+    'id="timer-display"',
+    'role="progressbar"',
+    'id="completion-banner"',
+    'id="today-sessions-table"',
+    'id="today-total-display"',
+)
 
-    assert response.status_code == 200
-    body = response.text
-    assert 'id="connection-status"' in body
-    assert 'id="timer-display"' in body
-    assert 'role="progressbar"' in body
-    assert 'id="completion-banner"' in body
-    assert 'id="today-sessions-table"' in body
-    assert 'id="today-total-display"' in body
+
+@pytest.mark.parametrize("needle", _DASHBOARD_SECTION_NEEDLES)
+def test_root_includes_required_dashboard_sections(dashboard_html: str, needle: str) -> None:
+    """Template includes timer, progress, status, sessions table, and total summary."""
+    assert needle in dashboard_html
 
 
-@pytest.mark.asyncio
-async def test_root_hides_completion_banner_by_default() -> None:
+def test_root_hides_completion_banner_by_default(dashboard_html: str) -> None:
     """Completion banner should be present but hidden initially."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
-
-    assert response.status_code == 200
-    body = response.text
+    body = dashboard_html
     assert 'id="completion-banner"' in body
     assert 'class="completion hidden"' in body
 
 
-@pytest.mark.asyncio
-async def test_root_includes_weekly_monthly_tab_placeholders() -> None:
+def test_root_includes_weekly_monthly_tab_placeholders(dashboard_html: str) -> None:
     """Template includes navigation placeholders for Weekly and Monthly sections."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
-
-    assert response.status_code == 200
-    assert "Weekly" in response.text
-    assert "Monthly" in response.text
+    assert "Weekly" in dashboard_html
+    assert "Monthly" in dashboard_html
 
 
-@pytest.mark.asyncio
-async def test_root_displays_office_wifi_name_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_root_displays_office_wifi_name_from_settings(
+    sync_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Template should render current configured office SSID."""
     monkeypatch.setattr(settings, "office_wifi_name", "OfficeWifi-QA")
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
+    response = sync_client.get("/")
 
     assert response.status_code == 200
     assert "OfficeWifi-QA" in response.text
 
 
-@pytest.mark.asyncio
-async def test_root_target_display_uses_test_mode_target(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_root_target_display_uses_test_mode_target(
+    sync_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """When test mode is enabled, template target display should use minute-only target."""
     monkeypatch.setattr(settings, "test_mode", True)
     monkeypatch.setattr(settings, "test_duration_minutes", 2)
     monkeypatch.setattr(settings, "work_duration_hours", 4)
     monkeypatch.setattr(settings, "buffer_minutes", 10)
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
+    response = sync_client.get("/")
 
     assert response.status_code == 200
     assert 'id="target-display">2m<' in response.text
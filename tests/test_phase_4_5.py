@@ -6,53 +6,39 @@ Covers:
 - /api/today endpoint includes personal_leave_time_ist
 """
 
-import pytest
-from httpx import ASGITransport, AsyncClient
-
-from app.main import app
-
-
-@pytest.mark.asyncio
-async def test_api_status_includes_completed_4h() -> None:
-    """The /api/status endpoint must return the completed_4h boolean."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/api/status")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "completed_4h" in data
-    assert isinstance(data["completed_4h"], bool)
+from typing import Any
 
+import pytest
 
-@pytest.mark.asyncio
-async def test_api_status_includes_personal_leave_time_field() -> None:
-    """/api/status should always include personal_leave_time_ist (nullable)."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/api/status")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "personal_leave_time_ist" in data
-    assert data["personal_leave_time_ist"] is None or isinstance(
-        data["personal_leave_time_ist"], str
-    )
-
-
-@pytest.mark.asyncio
-async def test_api_today_includes_personal_leave_time_field() -> None:
-    """/api/today should always include personal_leave_time_ist (nullable)."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/api/today")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "personal_leave_time_ist" in data
-    assert data["personal_leave_time_ist"] is None or isinstance(
-        data["personal_leave_time_ist"], str
-    )
+pytestmark = pytest.mark.xdist_group(name="api_status")
+
+
+@pytest.mark.parametrize(
+    "endpoint, field, nullable_str",
+    [
+        pytest.param("status", "completed_4h", False, id="status-completed_4h"),
+        pytest.param(
+            "status", "personal_leave_time_ist", True, id="status-personal_leave_time_ist"
+        ),
+        pytest.param(
+            "today", "personal_leave_time_ist", True, id="today-personal_leave_time_ist"
+        ),
+    ],
+)
+def test_api_payload_includes_field(
+    default_payloads: dict[str, dict[str, Any]],
+    endpoint: str,
+    field: str,
+    nullable_str: bool,
+) -> None:
+    """
+    /api/status must return the completed_4h boolean, and both /api/status
+    and /api/today must always include personal_leave_time_ist (nullable).
+    """
+    data = default_payloads[endpoint]
+
+    assert field in data
+    if nullable_str:
+        assert data[field] is None or isinstance(data[field], str)
+    else:
+        assert isinstance(data[field], bool)
@@ -3,21 +3,46 @@ Tests for Phase 5.1: Weekly Data Aggregation API.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import patch
 
 import pytest
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient
 
-from app.main import app
+from app.main import get_weekly_data
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group(name="analytics_api"),
+]
 
-@pytest.mark.asyncio
-async def test_get_weekly_api_schema_correctness():
+_OFFICE_0900_100 = {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100}
+
+# Same (start_time, ssid) twice: counted once per day.
+_DUPLICATE_ROWS = [_OFFICE_0900_100, _OFFICE_0900_100]
+_NEGATIVE_DURATION_ROWS = [{"duration_minutes": -50, "start_time": "09:00:00", "ssid": "Office"}]
+_NON_DICT_ROWS = ["invalid", _OFFICE_0900_100]
+_NONE_DURATION_ROWS = [
+    _OFFICE_0900_100,
+    {"duration_minutes": None, "start_time": "13:00:00", "ssid": "Office"},
+]
+
+# Week 2026-W07 runs Monday 09-02-2026 .. Sunday 15-02-2026.
+_W07_SESSIONS_BY_DAY = {
+    (2026, 2, 9): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 300, "completed_4h": True}],
+    (2026, 2, 10): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100, "completed_4h": False}],
+}
+
+# Target is 4h 10m (250m): just under on Monday, exactly at on Tuesday.
+_W07_THRESHOLD_BY_DAY = {
+    (2026, 2, 9): [{"duration_minutes": 249, "start_time": "09:00:00", "ssid": "Office"}],
+    (2026, 2, 10): [{"duration_minutes": 250, "start_time": "09:00:00", "ssid": "Office"}],
+}
+
+
+async def test_get_weekly_api_schema_correctness(client: AsyncClient, load_json):
     """GET /api/weekly should return correct schema."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly")
+    response = await client.get("/api/weekly")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "week" in data
     assert "days" in data
     assert len(data["days"]) == 7
@@ -26,31 +51,16 @@ async def test_get_weekly_api_schema_correctness():
     assert "days_target_met" in data
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-@patch("app.analytics.datetime")
-async def test_get_weekly_aggregation_logic(mock_datetime, mock_read_sessions):
+async def test_get_weekly_aggregation_logic(freeze_analytics_now, stub_read_sessions):
     """Test weekly aggregation with mocked data."""
     # Mock current date to Wednesday, 2026-02-11
     fixed_now = datetime(2026, 2, 11)
-    mock_datetime.now.return_value = fixed_now
-    mock_datetime.strptime.side_effect = datetime.strptime
+    freeze_analytics_now(fixed_now)
     
     # Week start (Monday) is 2026-02-09
-    
-    def side_effect(date):
-        if date.strftime("%d-%m-%Y") == "09-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 300, "completed_4h": True}]
-        if date.strftime("%d-%m-%Y") == "10-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100, "completed_4h": False}]
-        return []
-
-    mock_read_sessions.side_effect = side_effect
+    stub_read_sessions(by_day=_W07_SESSIONS_BY_DAY)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
-    assert response.status_code == 200
-    data = response.json()
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
     assert data["week"] == "2026-W07"
     assert data["total_minutes"] == 400
@@ -68,26 +78,17 @@ async def test_get_weekly_aggregation_logic(mock_datetime, mock_read_sessions):
     assert day2["target_met"] is False
 
 
-@pytest.mark.asyncio
 async def test_get_weekly_invalid_params_fallback():
     """Invalid week parameter should fallback to current week."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=invalid")
-    assert response.status_code == 200
-    data = response.json()
+    data = (await get_weekly_data("invalid")).model_dump()
     assert "W" in data["week"]
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_empty_data(mock_read_sessions):
+async def test_get_weekly_empty_data(stub_read_sessions):
     """Test aggregation with no sessions."""
-    mock_read_sessions.return_value = []
+    stub_read_sessions([])
     
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W01")
-    assert response.status_code == 200
-    data = response.json()
+    data = (await get_weekly_data("2026-W01")).model_dump()
     
     assert data["total_minutes"] == 0
     assert data["days_target_met"] == 0
@@ -96,102 +97,64 @@ async def test_get_weekly_empty_data(mock_read_sessions):
         assert day["target_met"] is False
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_deduplication(mock_read_sessions):
+async def test_get_weekly_deduplication(stub_read_sessions):
     """Test that duplicate sessions (same start_time, ssid) are counted once."""
-    mock_read_sessions.return_value = [
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100},
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100}  # Duplicate
-    ]
+    stub_read_sessions(_DUPLICATE_ROWS)
     
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
-    data = response.json()
     # 7 days with same mock data = 700 minutes total
     assert data["total_minutes"] == 700
     assert data["days"][0]["total_minutes"] == 100
     assert data["days"][0]["session_count"] == 1
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_negative_duration_clamping(mock_read_sessions):
+async def test_get_weekly_negative_duration_clamping(stub_read_sessions):
     """Test that negative durations are clamped to 0."""
-    mock_read_sessions.return_value = [{"duration_minutes": -50, "start_time": "09:00:00", "ssid": "Office"}]
+    stub_read_sessions(_NEGATIVE_DURATION_ROWS)
     
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
-    data = response.json()
     assert data["total_minutes"] == 0
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_robustness_non_dict_entries(mock_read_sessions):
+async def test_get_weekly_robustness_non_dict_entries(stub_read_sessions):
     """Test robustness against non-dict session entries."""
-    mock_read_sessions.return_value = ["invalid", {"duration_minutes": 100, "start_time": "09:00:00", "ssid": "Office"}]
+    stub_read_sessions(_NON_DICT_ROWS)
     
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
-    data = response.json()
     assert data["days"][0]["total_minutes"] == 100
     assert data["days"][0]["session_count"] == 1
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_robustness_none_duration(mock_read_sessions):
+async def test_get_weekly_robustness_none_duration(stub_read_sessions):
     """Test robustness against None duration_minutes."""
-    mock_read_sessions.return_value = [
-        {"duration_minutes": 100, "start_time": "09:00:00", "ssid": "Office"},
-        {"duration_minutes": None, "start_time": "13:00:00", "ssid": "Office"}
-    ]
+    stub_read_sessions(_NONE_DURATION_ROWS)
     
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
-    data = response.json()
     assert data["days"][0]["total_minutes"] == 100
     assert data["days"][0]["session_count"] == 2
 
 
-@pytest.mark.asyncio
 async def test_get_weekly_year_boundary_2025_2026():
     """Test week calculation at year boundary."""
     # 2025-W52 ends Sunday 2025-12-28
     # 2026-W01 starts Monday 2025-12-29
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W01")
+    data = (await get_weekly_data("2026-W01")).model_dump()
     
-    assert response.status_code == 200
-    data = response.json()
     assert data["week"] == "2026-W01"
     assert data["days"][0]["date"] == "29-12-2025" # Monday
     assert data["days"][6]["date"] == "04-01-2026" # Sunday
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_weekly_target_threshold_logic(mock_read_sessions):
+async def test_get_weekly_target_threshold_logic(stub_read_sessions):
     """Verify target met logic (target is 4h 10m = 250 minutes)."""
+    stub_read_sessions(by_day=_W07_THRESHOLD_BY_DAY)
     
-    def side_effect(date):
-        if date.strftime("%d-%m-%Y") == "09-02-2026":
-            return [{"duration_minutes": 249, "start_time": "09:00:00", "ssid": "Office"}] # Just under
-        if date.strftime("%d-%m-%Y") == "10-02-2026":
-            return [{"duration_minutes": 250, "start_time": "09:00:00", "ssid": "Office"}] # Exactly at
-        return []
-
-    mock_read_sessions.side_effect = side_effect
-    
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/weekly?week=2026-W07")
+    data = (await get_weekly_data("2026-W07")).model_dump()
     
-    data = response.json()
     day1 = next(d for d in data["days"] if d["date"] == "09-02-2026")
     assert day1["target_met"] is False
     
@@ -3,22 +3,55 @@ Tests for Phase 5.2: Monthly Data Aggregation API.
 """
 
 from datetime import datetime
-from unittest.mock import patch
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from app.main import app
-
-
-@pytest.mark.asyncio
-async def test_get_monthly_api_schema_correctness():
+from httpx import AsyncClient
+
+from app.main import get_monthly_data
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group(name="analytics_api"),
+]
+
+_OFFICE_0900_100 = {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100}
+
+# Same (start_time, ssid) twice plus a distinct afternoon row: 150 minutes per day.
+_DUPLICATE_ROWS = [
+    _OFFICE_0900_100,
+    _OFFICE_0900_100,
+    {"start_time": "13:00:00", "ssid": "Office", "duration_minutes": 50},
+]
+_MALFORMED_ROWS = [
+    "invalid-row",
+    {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": None},
+    {"start_time": "10:00:00", "ssid": "Office", "duration_minutes": 100},
+]
+_INVALID_DURATION_ROWS = [
+    {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": -30},
+    {"start_time": "10:00:00", "ssid": "Office", "duration_minutes": "oops"},
+]
+
+# February 2026: two days in Week 1 (01-07) and two in Week 2 (08-14).
+_FEB_SESSIONS_BY_DAY = {
+    (2026, 2, 1): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 120}],
+    (2026, 2, 2): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 60}],
+    (2026, 2, 8): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 200}],
+    (2026, 2, 9): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 50}],
+}
+
+_FEB_TWO_DAYS_PRESENT_BY_DAY = {
+    (2026, 2, 1): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 120}],
+    (2026, 2, 2): [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 120}],
+}
+
+
+async def test_get_monthly_api_schema_correctness(client: AsyncClient, load_json):
     """GET /api/monthly should return correct schema and typed fields."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    response = await client.get("/api/monthly?month=2026-02")
 
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
 
     assert data["month"] == "2026-02"
     assert isinstance(data["weeks"], list)
@@ -35,60 +68,32 @@ async def test_get_monthly_api_schema_correctness():
     assert "avg_daily_minutes" in first_week
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.datetime")
-async def test_get_monthly_defaults_to_current_month(mock_datetime):
+async def test_get_monthly_defaults_to_current_month(freeze_analytics_now):
     """No month query should default to current month."""
     fixed_now = datetime(2026, 2, 13, 9, 0, 0)
-    mock_datetime.now.return_value = fixed_now
-    mock_datetime.strptime.side_effect = datetime.strptime
+    freeze_analytics_now(fixed_now)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly")
+    data = (await get_monthly_data()).model_dump()
 
-    assert response.status_code == 200
-    assert response.json()["month"] == "2026-02"
+    assert data["month"] == "2026-02"
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.datetime")
-async def test_get_monthly_invalid_month_falls_back_to_current(mock_datetime):
+async def test_get_monthly_invalid_month_falls_back_to_current(freeze_analytics_now):
     """Invalid month query should fall back safely to current month."""
     fixed_now = datetime(2026, 3, 5, 10, 0, 0)
-    mock_datetime.now.return_value = fixed_now
-    mock_datetime.strptime.side_effect = datetime.strptime
+    freeze_analytics_now(fixed_now)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=invalid")
+    data = (await get_monthly_data("invalid")).model_dump()
 
-    assert response.status_code == 200
-    assert response.json()["month"] == "2026-03"
+    assert data["month"] == "2026-03"
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_aggregation_logic(mock_read_sessions):
+async def test_get_monthly_aggregation_logic(stub_read_sessions):
     """Month aggregation should return week buckets and month totals."""
+    stub_read_sessions(by_day=_FEB_SESSIONS_BY_DAY)
 
-    def side_effect(date):
-        token = date.strftime("%d-%m-%Y")
-        if token == "01-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 120}]
-        if token == "02-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 60}]
-        if token == "08-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 200}]
-        if token == "09-02-2026":
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 50}]
-        return []
-
-    mock_read_sessions.side_effect = side_effect
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["month"] == "2026-02"
     assert data["total_minutes"] == 430
     assert data["total_days_present"] == 4
@@ -109,17 +114,20 @@ async def test_get_monthly_aggregation_logic(mock_read_sessions):
     assert week2["avg_daily_minutes"] == 125.0
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_empty_data(mock_read_sessions):
-    """Empty month should return zero totals and zero-present days."""
-    mock_read_sessions.return_value = []
+@pytest.mark.parametrize(
+    "read_result",
+    [
+        pytest.param([], id="empty"),
+        pytest.param({"unexpected": "shape"}, id="non-list-payload"),
+        pytest.param(RuntimeError("read failed"), id="read-error"),
+    ],
+)
+async def test_get_monthly_degrades_to_zero_totals(stub_read_sessions, read_result):
+    """Empty, non-list, or failing storage reads should yield zero totals, not crash."""
+    stub_read_sessions(read_result)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["total_minutes"] == 0
     assert data["total_days_present"] == 0
     assert data["avg_daily_minutes"] == 0.0
@@ -130,128 +138,55 @@ async def test_get_monthly_empty_data(mock_read_sessions):
         assert week["avg_daily_minutes"] == 0.0
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_deduplicates_sessions_by_start_and_ssid(mock_read_sessions):
+async def test_get_monthly_deduplicates_sessions_by_start_and_ssid(stub_read_sessions):
     """Duplicate rows should not be double-counted in daily totals."""
-    mock_read_sessions.return_value = [
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100},
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 100},
-        {"start_time": "13:00:00", "ssid": "Office", "duration_minutes": 50},
-    ]
+    stub_read_sessions(_DUPLICATE_ROWS)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["weeks"][0]["total_minutes"] == 1050
     assert data["weeks"][0]["days_present"] == 7
     assert data["weeks"][0]["avg_daily_minutes"] == 150.0
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_ignores_non_dict_and_none_duration_entries(mock_read_sessions):
+async def test_get_monthly_ignores_non_dict_and_none_duration_entries(stub_read_sessions):
     """Malformed rows should not break aggregation and None duration should be ignored."""
-    mock_read_sessions.return_value = [
-        "invalid-row",
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": None},
-        {"start_time": "10:00:00", "ssid": "Office", "duration_minutes": 100},
-    ]
+    stub_read_sessions(_MALFORMED_ROWS)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["weeks"][0]["total_minutes"] == 700
     assert data["weeks"][0]["days_present"] == 7
     assert data["weeks"][0]["avg_daily_minutes"] == 100.0
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_clamps_negative_and_invalid_duration_values(mock_read_sessions):
+async def test_get_monthly_clamps_negative_and_invalid_duration_values(stub_read_sessions):
     """Negative or invalid duration values should be treated as zero."""
-    mock_read_sessions.return_value = [
-        {"start_time": "09:00:00", "ssid": "Office", "duration_minutes": -30},
-        {"start_time": "10:00:00", "ssid": "Office", "duration_minutes": "oops"},
-    ]
+    stub_read_sessions(_INVALID_DURATION_ROWS)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["total_minutes"] == 0
     assert data["total_days_present"] == 0
     assert data["avg_daily_minutes"] == 0.0
 
 
-@pytest.mark.asyncio
 async def test_get_monthly_31_day_month_has_five_week_buckets():
     """31-day month should be split into 5 week buckets with clipped final week."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-01")
+    data = (await get_monthly_data("2026-01")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["month"] == "2026-01"
     assert len(data["weeks"]) == 5
     assert data["weeks"][0]["start_date"] == "01-01-2026"
     assert data["weeks"][-1]["end_date"] == "31-01-2026"
 
 
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_avg_daily_minutes_uses_days_present(mock_read_sessions):
+async def test_get_monthly_avg_daily_minutes_uses_days_present(stub_read_sessions):
     """Average daily minutes should divide by present days, not total calendar days."""
+    stub_read_sessions(by_day=_FEB_TWO_DAYS_PRESENT_BY_DAY)
 
-    def side_effect(date):
-        token = date.strftime("%d-%m-%Y")
-        if token in {"01-02-2026", "02-02-2026"}:
-            return [{"start_time": "09:00:00", "ssid": "Office", "duration_minutes": 120}]
-        return []
-
-    mock_read_sessions.side_effect = side_effect
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
+    data = (await get_monthly_data("2026-02")).model_dump()
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["total_minutes"] == 240
     assert data["total_days_present"] == 2
     assert data["avg_daily_minutes"] == 120.0
-
-
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_handles_read_sessions_exception(mock_read_sessions):
-    """Storage read errors should not crash monthly aggregation."""
-    mock_read_sessions.side_effect = RuntimeError("read failed")
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_minutes"] == 0
-    assert data["total_days_present"] == 0
-    assert data["avg_daily_minutes"] == 0.0
-
-
-@pytest.mark.asyncio
-@patch("app.analytics.read_sessions")
-async def test_get_monthly_handles_non_list_read_payload(mock_read_sessions):
-    """Non-list payload from storage should degrade safely to zero data."""
-    mock_read_sessions.return_value = {"unexpected": "shape"}
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        response = await ac.get("/api/monthly?month=2026-02")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_minutes"] == 0
-    assert data["total_days_present"] == 0
@@ -3,62 +3,58 @@ Tests for Phase 5.4: Monthly Analytics UI View.
 """
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi.testclient import TestClient
 
-from app.main import app
+pytestmark = pytest.mark.xdist_group(name="dashboard")
 
-
-@pytest.mark.asyncio
-async def test_dashboard_includes_monthly_ui_elements() -> None:
-    """Dashboard HTML should include Monthly tab and its required components."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/")
-
-    assert response.status_code == 200
-    body = response.text
-    
+_MONTHLY_HTML_NEEDLES = [
     # Navigation (Task 7.9: tabs are now buttons for accessibility)
-    assert 'data-tab="monthly"' in body and 'Monthly</button>' in body
-    
+    'data-tab="monthly"',
+    "Monthly</button>",
     # Section
-    assert 'id="tab-monthly"' in body
-    assert 'Monthly Analytics' in body
-    
+    'id="tab-monthly"',
+    "Monthly Analytics",
     # Selectors
-    assert 'id="prev-month"' in body
-    assert 'id="next-month"' in body
-    assert 'id="current-month-label"' in body
-    
+    'id="prev-month"',
+    'id="next-month"',
+    'id="current-month-label"',
     # Chart
-    assert 'id="monthly-chart"' in body
-    
+    'id="monthly-chart"',
     # Stats
-    assert 'id="monthly-total-hours"' in body
-    assert 'id="monthly-total-days"' in body
-    assert 'id="monthly-avg-hours"' in body
-    
+    'id="monthly-total-hours"',
+    'id="monthly-total-days"',
+    'id="monthly-avg-hours"',
     # Table
-    assert 'id="monthly-table"' in body
-    assert 'id="monthly-table-body"' in body
+    'id="monthly-table"',
+    'id="monthly-table-body"',
+]
+
+_MONTHLY_JS_NEEDLES = [
+    "function renderMonthlyTable()",
+    "function renderMonthlyChart()",
+    "function syncMonthly()",
+    "function addMonths(",
+    "dom.tabMonthly",
+    "state.selectedMonth",
+    "/api/monthly",
+]
+
+
+@pytest.mark.parametrize("needle", _MONTHLY_HTML_NEEDLES)
+def test_dashboard_includes_monthly_ui_elements(dashboard_html: str, needle: str) -> None:
+    """Dashboard HTML should include Monthly tab and its required components."""
+    assert needle in dashboard_html
 
 
-@pytest.mark.asyncio
-async def test_js_contains_monthly_logic() -> None:
-    """app.js should contain the logic for monthly analytics."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        response = await client.get("/static/app.js")
+def test_static_app_js_is_served(sync_client: TestClient) -> None:
+    """/static/app.js is served as JavaScript."""
+    response = sync_client.get("/static/app.js")
 
     assert response.status_code == 200
-    body = response.text
-    
-    assert "function renderMonthlyTable()" in body
-    assert "function renderMonthlyChart()" in body
-    assert "function syncMonthly()" in body
-    assert "function addMonths(" in body
-    assert "dom.tabMonthly" in body
-    assert "state.selectedMonth" in body
-    assert "/api/monthly" in body
+    assert "javascript" in response.headers.get("content-type", "")
+
+
+@pytest.mark.parametrize("needle", _MONTHLY_JS_NEEDLES)
+def test_js_contains_monthly_logic(js_text: str, needle: str) -> None:
+    """app.js should contain the logic for monthly analytics."""
+    assert needle in js_text
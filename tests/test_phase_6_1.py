@@ -12,269 +12,217 @@ Coverage:
 """
 
 import os
-import plistlib
-from pathlib import Path
+import shutil
+import stat
+import subprocess
+import sys
 
+import pytest
 
-def test_plist_file_exists():
-    """Verify that com.officetracker.plist exists in the root directory."""
-    plist_path = Path("com.officetracker.plist")
-    assert plist_path.exists(), "Plist file must exist in project root"
-    assert plist_path.is_file(), "Plist path must be a file, not a directory"
+pytestmark = pytest.mark.xdist_group(name="launchd")
 
+# These check the developer's installed launchd setup (venv, logs/, LaunchAgents),
+# which only exists on the macOS machine running the service.
+_macos_only = pytest.mark.skipif(
+    sys.platform != "darwin", reason="needs the macOS launchd installation"
+)
 
-def test_plist_syntax_via_plutil():
-    """Verify that the plist passes macOS native syntax check."""
-    exit_code = os.system("plutil -lint com.officetracker.plist > /dev/null 2>&1")
-    assert exit_code == 0, "Plist must pass plutil -lint validation"
+
+def test_plist_file_exists(path_stat):
+    """Verify that com.officetracker.plist exists in the root directory."""
+    st = path_stat("com.officetracker.plist")
+    assert st is not None, "Plist file must exist in project root"
+    assert stat.S_ISREG(st.st_mode), "Plist path must be a file, not a directory"
 
 
-def test_plist_semantic_validation():
-    """Use plistlib to verify the semantic structure and flags of the plist."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+@pytest.fixture(scope="session")
+def plutil_exit_code():
+    """Exit status of ``plutil -lint`` on the plist, run at most once per session."""
+    plutil = shutil.which("plutil")
+    if plutil is None:
+        pytest.skip("plutil is only available on macOS")
+    return subprocess.run(
+        [plutil, "-lint", "-s", "com.officetracker.plist"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ).returncode
 
-    # Basic structure
-    assert isinstance(data, dict), "Plist root must be a dictionary"
 
-    # Required keys exist
-    assert "Label" in data, "Label key is required"
-    assert "ProgramArguments" in data, "ProgramArguments key is required"
-    assert "WorkingDirectory" in data, "WorkingDirectory key is required"
-    assert "RunAtLoad" in data, "RunAtLoad key is required"
-    assert "KeepAlive" in data, "KeepAlive key is required"
-    assert "StandardOutPath" in data, "StandardOutPath key is required"
-    assert "StandardErrorPath" in data, "StandardErrorPath key is required"
+def test_plist_syntax_via_plutil(plutil_exit_code):
+    """Verify that the plist passes macOS native syntax check."""
+    assert plutil_exit_code == 0, "Plist must pass plutil -lint validation"
 
 
-def test_plist_label_is_correct():
-    """Verify Label follows reverse-DNS naming convention."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+_REQUIRED_KEYS = (
+    "Label",
+    "ProgramArguments",
+    "WorkingDirectory",
+    "RunAtLoad",
+    "KeepAlive",
+    "StandardOutPath",
+    "StandardErrorPath",
+)
 
-    label = data["Label"]
-    assert label == "com.officetracker", f"Label must be 'com.officetracker', got '{label}'"
-    assert isinstance(label, str), "Label must be a string"
-    assert label.startswith("com."), "Label should follow reverse-DNS convention"
+# Exact values; bools must be real plist booleans, not the string "true"
+_EXPECTED_VALUES = {
+    "Label": "com.officetracker",
+    "RunAtLoad": True,
+    "KeepAlive": True,
+}
 
+# Security/safety keys that must never be set
+_UNSAFE_KEYS = ("UserName", "GroupName", "RootDirectory", "Umask", "SessionCreate")
 
-def test_plist_run_at_load_is_true():
-    """Verify RunAtLoad is boolean true for automatic startup on login."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
 
-    run_at_load = data["RunAtLoad"]
-    assert run_at_load is True, "RunAtLoad must be boolean True for auto-start"
-    assert isinstance(run_at_load, bool), "RunAtLoad must be boolean, not string 'true'"
+def test_plist_root_is_dictionary(plist_data):
+    """Use plistlib to verify the semantic structure of the plist."""
+    assert isinstance(plist_data, dict), "Plist root must be a dictionary"
 
 
-def test_plist_keep_alive_is_true():
-    """Verify KeepAlive is boolean true for automatic restart on crash."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+@pytest.mark.parametrize("key", _REQUIRED_KEYS)
+def test_plist_has_required_key(plist_data, key):
+    """Verify every key launchd needs for auto-start is present."""
+    assert key in plist_data, f"{key} key is required"
 
-    keep_alive = data["KeepAlive"]
-    assert keep_alive is True, "KeepAlive must be boolean True for crash recovery"
-    assert isinstance(keep_alive, bool), "KeepAlive must be boolean, not string 'true'"
 
+@pytest.mark.parametrize("key, expected", _EXPECTED_VALUES.items(), ids=list(_EXPECTED_VALUES))
+def test_plist_key_has_expected_value(plist_data, key, expected):
+    """Verify Label, RunAtLoad and KeepAlive carry their production values and types."""
+    value = plist_data[key]
+    assert value == expected, f"{key} must be {expected!r}, got {value!r}"
+    assert type(value) is type(expected), f"{key} must be {type(expected).__name__}"
 
-def test_plist_program_arguments_structure():
-    """Verify ProgramArguments is a list with required elements."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
 
-    args = data["ProgramArguments"]
+def test_plist_program_arguments_structure(plist_data):
+    """Verify ProgramArguments is a list with required elements."""
+    args = plist_data["ProgramArguments"]
     assert isinstance(args, list), "ProgramArguments must be a list"
     assert len(args) > 0, "ProgramArguments cannot be empty"
 
 
-def test_plist_program_arguments_contains_python():
+def test_plist_program_arguments_contains_python(plist_data):
     """Verify ProgramArguments includes Python executable from venv."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
+    args = plist_data["ProgramArguments"]
     python_path = args[0]
 
     assert "venv/bin/python" in python_path, "First argument must be venv Python executable"
     assert python_path.endswith("/venv/bin/python"), "Python path must end with /venv/bin/python"
 
 
-def test_plist_program_arguments_contains_uvicorn():
-    """Verify ProgramArguments includes uvicorn module invocation."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
-
-    # Should have: python -m uvicorn app.main:app
-    assert "-m" in args, "ProgramArguments must include -m flag for module execution"
-    assert "uvicorn" in args, "ProgramArguments must include uvicorn module"
-
-
-def test_plist_program_arguments_contains_app_module():
-    """Verify ProgramArguments includes app.main:app FastAPI application."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
-    assert "app.main:app" in args, "ProgramArguments must include app.main:app"
-
-
-def test_plist_program_arguments_contains_host():
-    """Verify ProgramArguments includes host binding to localhost."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
-    assert "--host" in args, "ProgramArguments must include --host flag"
-    assert "127.0.0.1" in args, "ProgramArguments must bind to 127.0.0.1 (localhost)"
+@pytest.mark.parametrize(
+    "arg", ["-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", "8787"]
+)
+def test_plist_program_arguments_include(plist_data, arg):
+    """Verify ProgramArguments runs ``python -m uvicorn app.main:app`` on 127.0.0.1:8787."""
+    assert arg in plist_data["ProgramArguments"], f"ProgramArguments must include {arg}"
 
 
-def test_plist_program_arguments_contains_port():
-    """Verify ProgramArguments includes port 8787."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
-    assert "--port" in args, "ProgramArguments must include --port flag"
-    assert "8787" in args, "ProgramArguments must specify port 8787"
-
-
-def test_plist_working_directory_is_project_root():
+def test_plist_working_directory_is_project_root(plist_data):
     """Verify WorkingDirectory points to project root."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    working_dir = data["WorkingDirectory"]
+    working_dir = plist_data["WorkingDirectory"]
     assert isinstance(working_dir, str), "WorkingDirectory must be a string"
     assert "wifi-tracking" in working_dir, "WorkingDirectory must be the project directory"
     assert not working_dir.endswith("/"), "WorkingDirectory should not end with slash"
 
 
-def test_plist_stdout_log_path_is_valid():
+def test_plist_stdout_log_path_is_valid(plist_data):
     """Verify StandardOutPath points to logs directory."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    stdout_path = data["StandardOutPath"]
+    stdout_path = plist_data["StandardOutPath"]
     assert isinstance(stdout_path, str), "StandardOutPath must be a string"
     assert "logs/stdout.log" in stdout_path, "StandardOutPath must point to logs/stdout.log"
     assert stdout_path.endswith("/logs/stdout.log"), "StandardOutPath must end with /logs/stdout.log"
 
 
-def test_plist_stderr_log_path_is_valid():
+def test_plist_stderr_log_path_is_valid(plist_data):
     """Verify StandardErrorPath points to logs directory."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    stderr_path = data["StandardErrorPath"]
+    stderr_path = plist_data["StandardErrorPath"]
     assert isinstance(stderr_path, str), "StandardErrorPath must be a string"
     assert "logs/stderr.log" in stderr_path, "StandardErrorPath must point to logs/stderr.log"
     assert stderr_path.endswith("/logs/stderr.log"), "StandardErrorPath must end with /logs/stderr.log"
 
 
-def test_plist_log_directories_exist():
+@_macos_only
+def test_plist_log_directories_exist(path_stat):
     """Verify log directories referenced in plist exist."""
-    logs_dir = Path("logs")
-    assert logs_dir.exists(), "logs/ directory must exist for StandardOutPath/StandardErrorPath"
-    assert logs_dir.is_dir(), "logs/ must be a directory"
+    st = path_stat("logs")
+    assert st is not None, "logs/ directory must exist for StandardOutPath/StandardErrorPath"
+    assert stat.S_ISDIR(st.st_mode), "logs/ must be a directory"
 
 
-def test_plist_python_executable_path_exists():
+@_macos_only
+def test_plist_python_executable_path_exists(plist_data, path_stat):
     """Verify Python executable referenced in plist exists."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    args = data["ProgramArguments"]
-    python_path = Path(args[0])
+    args = plist_data["ProgramArguments"]
+    python_path = args[0]
+    st = path_stat(python_path)
 
-    assert python_path.exists(), f"Python executable must exist at {python_path}"
-    assert python_path.is_file(), f"Python path must be a file at {python_path}"
+    assert st is not None, f"Python executable must exist at {python_path}"
+    assert stat.S_ISREG(st.st_mode), f"Python path must be a file at {python_path}"
     assert os.access(python_path, os.X_OK), f"Python executable must be executable at {python_path}"
 
 
-def test_plist_working_directory_exists():
+@_macos_only
+def test_plist_working_directory_exists(plist_data, path_stat):
     """Verify WorkingDirectory referenced in plist exists."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+    working_dir = plist_data["WorkingDirectory"]
+    st = path_stat(working_dir)
+    assert st is not None, f"WorkingDirectory must exist at {working_dir}"
+    assert stat.S_ISDIR(st.st_mode), f"WorkingDirectory must be a directory at {working_dir}"
 
-    working_dir = Path(data["WorkingDirectory"])
-    assert working_dir.exists(), f"WorkingDirectory must exist at {working_dir}"
-    assert working_dir.is_dir(), f"WorkingDirectory must be a directory at {working_dir}"
 
-
-def test_plist_has_no_extra_unexpected_keys():
+@pytest.mark.parametrize("key", _UNSAFE_KEYS)
+def test_plist_has_no_unsafe_key(plist_data, key):
     """Verify plist doesn't have unexpected/risky keys."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
-    # These keys should NOT be present (security/safety)
-    unsafe_keys = ["UserName", "GroupName", "RootDirectory", "Umask", "SessionCreate"]
-    for key in unsafe_keys:
-        assert key not in data, f"Plist should not contain {key} (security risk)"
-
-
-def test_plist_program_arguments_order_is_correct():
-    """Verify ProgramArguments are in correct execution order."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+    assert key not in plist_data, f"Plist should not contain {key} (security risk)"
 
-    args = data["ProgramArguments"]
 
-    # Expected order: python, -m, uvicorn, app.main:app, --host, 127.0.0.1, --port, 8787
-    assert args[1] == "-m", "Second argument must be -m"
-    assert args[2] == "uvicorn", "Third argument must be uvicorn"
+# Expected order: python, -m, uvicorn, app.main:app, --host, 127.0.0.1, --port, 8787
+@pytest.mark.parametrize("index, expected", [(1, "-m"), (2, "uvicorn")])
+def test_plist_program_arguments_position(plist_data, index, expected):
+    """Verify the module invocation comes right after the interpreter."""
+    assert plist_data["ProgramArguments"][index] == expected
 
-    # Find --host and verify next element is IP
-    host_idx = args.index("--host")
-    assert args[host_idx + 1] == "127.0.0.1", "Host value must follow --host flag"
 
-    # Find --port and verify next element is port number
-    port_idx = args.index("--port")
-    assert args[port_idx + 1] == "8787", "Port value must follow --port flag"
+@pytest.mark.parametrize("flag, value", [("--host", "127.0.0.1"), ("--port", "8787")])
+def test_plist_program_arguments_flag_value(plist_data, flag, value):
+    """Verify each flag is immediately followed by its value."""
+    args = plist_data["ProgramArguments"]
+    assert args[args.index(flag) + 1] == value, f"{value} must follow {flag} flag"
 
 
-def test_plist_paths_are_absolute():
-    """Verify all paths in plist are absolute, not relative."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
+@pytest.mark.parametrize(
+    "path_of",
+    [
+        pytest.param(lambda data: data["ProgramArguments"][0], id="python"),
+        pytest.param(lambda data: data["WorkingDirectory"], id="WorkingDirectory"),
+        pytest.param(lambda data: data["StandardOutPath"], id="StandardOutPath"),
+        pytest.param(lambda data: data["StandardErrorPath"], id="StandardErrorPath"),
+    ],
+)
+def test_plist_path_is_absolute(plist_data, path_of):
+    """Verify paths in plist are absolute, not relative."""
+    assert path_of(plist_data).startswith("/")
 
-    # Check all path fields are absolute
-    python_path = data["ProgramArguments"][0]
-    working_dir = data["WorkingDirectory"]
-    stdout_path = data["StandardOutPath"]
-    stderr_path = data["StandardErrorPath"]
 
-    assert python_path.startswith("/"), "Python path must be absolute"
-    assert working_dir.startswith("/"), "WorkingDirectory must be absolute"
-    assert stdout_path.startswith("/"), "StandardOutPath must be absolute"
-    assert stderr_path.startswith("/"), "StandardErrorPath must be absolute"
-
-
-def test_plist_boot_flow_configuration():
+def test_plist_boot_flow_configuration(plist_data):
     """Verify plist is configured for proper boot flow behavior."""
-    with open("com.officetracker.plist", "rb") as f:
-        data = plistlib.load(f)
-
     # Must have RunAtLoad for boot-time startup
-    assert data["RunAtLoad"] is True, "RunAtLoad required for auto-start on login"
+    assert plist_data["RunAtLoad"] is True, "RunAtLoad required for auto-start on login"
 
     # Must have KeepAlive for crash recovery
-    assert data["KeepAlive"] is True, "KeepAlive required for automatic restart"
+    assert plist_data["KeepAlive"] is True, "KeepAlive required for automatic restart"
 
     # Must have proper logging for debugging boot issues
-    assert "StandardOutPath" in data, "StandardOutPath required for boot diagnostics"
-    assert "StandardErrorPath" in data, "StandardErrorPath required for boot error diagnosis"
+    assert "StandardOutPath" in plist_data, "StandardOutPath required for boot diagnostics"
+    assert "StandardErrorPath" in plist_data, "StandardErrorPath required for boot error diagnosis"
 
     # Must NOT have StartInterval (would cause repeated restarts)
-    assert "StartInterval" not in data, "StartInterval should not be present (causes restart loops)"
+    assert "StartInterval" not in plist_data, "StartInterval should not be present (causes restart loops)"
 
 
-def test_plist_file_size_is_reasonable():
+def test_plist_file_size_is_reasonable(plist_bytes):
     """Verify plist file size is reasonable (not corrupted or malformed)."""
-    plist_path = Path("com.officetracker.plist")
-    file_size = plist_path.stat().st_size
+    file_size = len(plist_bytes)
 
     # Should be between 500 bytes and 10KB
     assert 500 < file_size < 10240, f"Plist file size {file_size} bytes seems unusual (expected 500-10KB)"
@@ -8,100 +8,103 @@ Covers:
 """
 
 import asyncio
+import inspect
+
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from app.main import lifespan, app
 
+pytestmark = pytest.mark.xdist_group(name="lifespan")
+
 
 @pytest.mark.asyncio
-async def test_lifespan_cancels_background_tasks_on_shutdown():
+async def test_lifespan_cancels_background_tasks_on_shutdown(lifespan_env):
     """Lifespan should cancel all background tasks during shutdown."""
-    with patch("app.main.wifi_polling_loop", new_callable=AsyncMock) as mock_wifi_loop, \
-         patch("app.main.timer_polling_loop", new_callable=AsyncMock) as mock_timer_loop, \
-         patch("app.main.get_current_ssid", return_value=None), \
-         patch("app.main.MongoDBStore.connect", new_callable=AsyncMock), \
-         patch("app.main.MongoDBStore.close_stale_sessions", new_callable=AsyncMock, return_value=0), \
-         patch("app.main.MongoDBStore.disconnect", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.initialize", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.cleanup", new_callable=AsyncMock), \
-         patch("app.session_manager.SessionManager.recover_session", new_callable=AsyncMock, return_value=False):
-
-        # Enter lifespan context
-        async with lifespan(app):
-            # Background tasks should be running
-            assert mock_wifi_loop.called
-            assert mock_timer_loop.called
+    # Enter lifespan context
+    async with lifespan(app):
+        # Background tasks should be running
+        assert lifespan_env.wifi_polling_loop.called
+        assert lifespan_env.timer_polling_loop.called
 
-        # After exiting context, tasks should be cancelled
-        # asyncio.gather is called with return_exceptions=True in shutdown
+    # After exiting context, tasks should be cancelled
+    # asyncio.gather is called with return_exceptions=True in shutdown
 
 
 @pytest.mark.asyncio
-async def test_lifespan_clears_background_tasks_list():
-    """Lifespan should clear _background_tasks list on shutdown."""
-    from app.main import _background_tasks
-
-    with patch("app.main.wifi_polling_loop", new_callable=AsyncMock), \
-         patch("app.main.timer_polling_loop", new_callable=AsyncMock), \
-         patch("app.main.get_current_ssid", return_value=None), \
-         patch("app.main.MongoDBStore.connect", new_callable=AsyncMock), \
-         patch("app.main.MongoDBStore.close_stale_sessions", new_callable=AsyncMock, return_value=0), \
-         patch("app.main.MongoDBStore.disconnect", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.initialize", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.cleanup", new_callable=AsyncMock), \
-         patch("app.session_manager.SessionManager.recover_session", new_callable=AsyncMock, return_value=False):
-
-        # Enter and exit lifespan context
-        async with lifespan(app):
-            pass
+async def test_lifespan_clears_background_tasks_list(lifespan_env):
+    """Lifespan should clear its background task registry on shutdown."""
+    tasks: list[asyncio.Task] = []
 
-        # After shutdown, background tasks list should be empty
-        assert len(_background_tasks) == 0
+    # Enter and exit lifespan context
+    async with lifespan(app, tasks):
+        assert len(tasks) == 3
+
+    # After shutdown, background tasks list should be empty
+    assert tasks == []
 
 
 @pytest.mark.asyncio
-async def test_lifespan_handles_task_exceptions_gracefully():
+async def test_lifespan_handles_task_exceptions_gracefully(
+    lifespan_env, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
     """Lifespan shutdown should handle task exceptions without crashing."""
+    wifi_started = asyncio.Event()
+    timer_started = asyncio.Event()
 
     async def failing_wifi_loop():
         """Simulates a failing wifi polling loop."""
-        await asyncio.sleep(0.1)
+        wifi_started.set()
         raise ValueError("Simulated wifi loop failure")
 
     async def failing_timer_loop():
         """Simulates a failing timer polling loop."""
-        await asyncio.sleep(0.1)
+        timer_started.set()
         raise RuntimeError("Simulated timer loop failure")
 
-    with patch("app.main.wifi_polling_loop", new=failing_wifi_loop), \
-         patch("app.main.timer_polling_loop", new=failing_timer_loop), \
-         patch("app.main.get_current_ssid", return_value=None), \
-         patch("app.main.MongoDBStore.connect", new_callable=AsyncMock), \
-         patch("app.main.MongoDBStore.close_stale_sessions", new_callable=AsyncMock, return_value=0), \
-         patch("app.main.MongoDBStore.disconnect", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.initialize", new_callable=AsyncMock), \
-         patch("app.main.NetworkConnectivityChecker.cleanup", new_callable=AsyncMock), \
-         patch("app.session_manager.SessionManager.recover_session", new_callable=AsyncMock, return_value=False):
-
-        # Lifespan should not raise despite task failures
+    monkeypatch.setattr("app.main.wifi_polling_loop", failing_wifi_loop)
+    monkeypatch.setattr("app.main.timer_polling_loop", failing_timer_loop)
+
+    # Lifespan should not raise despite task failures
+    try:
+        async with lifespan(app):
+            # Both loops have run and raised before shutdown begins; the
+            # timeout only guards against a hang if a loop never starts
+            await asyncio.wait_for(
+                asyncio.gather(wifi_started.wait(), timer_started.wait()), timeout=1
+            )
+        # Should reach here without exception
+        assert True
+    except (ValueError, RuntimeError):
+        pytest.fail("Lifespan should handle task exceptions gracefully")
+
+    # The swallowed failures are still reported
+    assert "Simulated wifi loop failure" in caplog.text
+    assert "Simulated timer loop failure" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_graceful_shutdown_tolerates_errors_raised_on_cancel(lifespan_env):
+    """Shutdown should collect, not propagate, errors a task raises while being cancelled."""
+    running = asyncio.Event()
+
+    async def loop_failing_on_cancel():
+        running.set()
         try:
-            async with lifespan(app):
-                await asyncio.sleep(0.2)  # Let tasks fail
-            # Should reach here without exception
-            assert True
-        except (ValueError, RuntimeError):
-            pytest.fail("Lifespan should handle task exceptions gracefully")
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            raise RuntimeError("Simulated cleanup failure during cancellation")
 
+    lifespan_env.wifi_polling_loop.side_effect = loop_failing_on_cancel
+    tasks: list[asyncio.Task] = []
 
-def test_graceful_shutdown_uses_return_exceptions():
-    """Verify lifespan uses return_exceptions=True in asyncio.gather."""
-    import inspect
-    from app.main import lifespan
+    async with lifespan(app, tasks):
+        await asyncio.wait_for(running.wait(), timeout=1)
+
+    assert tasks == []
 
-    # Get the source code of the lifespan function
-    source = inspect.getsource(lifespan)
 
-    # Should use asyncio.gather with return_exceptions=True
-    assert "asyncio.gather" in source
-    assert "return_exceptions=True" in source
+def test_shutdown_code_has_no_stale_todo_comments():
+    """Shutdown handling should be finished, not left as TODO/FIXME notes."""
+    source = inspect.getsource(lifespan)
+    assert "TODO" not in source
+    assert "FIXME" not in source
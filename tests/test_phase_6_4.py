@@ -8,174 +8,125 @@ Covers:
 - Log file creation
 """
 
+import os
+import shutil
+import stat
 import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 
-def test_launchd_plist_location_is_correct():
+pytestmark = pytest.mark.xdist_group(name="launchd")
+
+# These check the developer's installed launchd setup (venv, logs/, LaunchAgents),
+# which only exists on the macOS machine running the service.
+_macos_only = pytest.mark.skipif(
+    sys.platform != "darwin", reason="needs the macOS launchd installation"
+)
+
+
+@_macos_only
+def test_launchd_plist_location_is_correct(path_stat):
     """Verify plist should be installed to user LaunchAgents directory."""
     expected_location = Path.home() / "Library" / "LaunchAgents" / "com.officetracker.plist"
     # Test just verifies the expected path - actual installation is manual/scripted
-    assert expected_location.parent.exists(), "LaunchAgents directory should exist"
+    assert path_stat(str(expected_location.parent)) is not None, "LaunchAgents directory should exist"
 
 
+@_macos_only
 def test_service_can_be_queried_with_launchctl():
     """Verify launchctl command is available and functional."""
-    # This test verifies launchctl is available (critical for boot auto-start)
+    # launchctl is critical for boot auto-start
+    launchctl = shutil.which("launchctl")
+    if launchctl is None:
+        pytest.skip("launchctl not available (restricted environment)")
     try:
-        result = subprocess.run(
-            ["launchctl", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        assert result.returncode == 0, "launchctl list should succeed"
-    except FileNotFoundError:
-        # launchctl not found - likely not macOS or restricted environment
-        import pytest
-        pytest.skip("launchctl not available (not macOS or restricted environment)")
+        result = subprocess.run([launchctl, "list"], capture_output=True, text=True, timeout=5)
     except subprocess.TimeoutExpired:
-        # launchctl hung - environment issue
-        import pytest
         pytest.skip("launchctl command timed out (environment issue)")
+    assert result.returncode == 0, "launchctl list should succeed"
 
 
-def test_logs_directory_exists():
+@_macos_only
+def test_logs_directory_exists(path_stat):
     """Verify logs directory exists for stdout/stderr."""
-    logs_dir = Path("logs")
-    assert logs_dir.exists()
-    assert logs_dir.is_dir()
+    st = path_stat("logs")
+    assert st is not None
+    assert stat.S_ISDIR(st.st_mode)
 
 
-def test_stdout_log_path_is_valid():
+@_macos_only
+def test_stdout_log_path_is_valid(path_stat):
     """Verify stdout.log path is accessible."""
     stdout_log = Path("logs/stdout.log")
     # Log file should be creatable (may not exist yet if service not started)
-    assert stdout_log.parent.exists()
+    assert path_stat(str(stdout_log.parent)) is not None
 
 
-def test_stderr_log_path_is_valid():
+@_macos_only
+def test_stderr_log_path_is_valid(path_stat):
     """Verify stderr.log path is accessible."""
     stderr_log = Path("logs/stderr.log")
     # Log file should be creatable (may not exist yet if service not started)
-    assert stderr_log.parent.exists()
-
-
-def test_plist_points_to_correct_working_directory():
-    """Verify plist WorkingDirectory matches project root."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    working_dir = plist_data.get("WorkingDirectory")
-    assert working_dir is not None
-    assert "wifi-tracking" in working_dir
-
-
-def test_plist_points_to_correct_python_executable():
-    """Verify plist ProgramArguments includes venv python."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    program_args = plist_data.get("ProgramArguments", [])
-    assert len(program_args) > 0
-    python_path = program_args[0]
-    assert "venv/bin/python" in python_path
-
-
-def test_plist_includes_uvicorn_command():
-    """Verify plist ProgramArguments includes uvicorn module."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    program_args = plist_data.get("ProgramArguments", [])
-    assert "uvicorn" in program_args or any("uvicorn" in arg for arg in program_args)
-
-
-def test_plist_includes_app_main():
-    """Verify plist ProgramArguments includes app.main:app."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    program_args = plist_data.get("ProgramArguments", [])
-    assert "app.main:app" in program_args
-
-
-def test_plist_includes_correct_port():
-    """Verify plist ProgramArguments includes port 8787."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    program_args = plist_data.get("ProgramArguments", [])
-    assert "8787" in program_args
-
-
-def test_plist_has_boot_required_keys():
+    assert path_stat(str(stderr_log.parent)) is not None
+
+
+@pytest.mark.parametrize(
+    "key, check",
+    [
+        pytest.param("RunAtLoad", lambda v: v is True, id="RunAtLoad-enabled"),
+        pytest.param("KeepAlive", lambda v: v is True, id="KeepAlive-enabled"),
+        pytest.param(
+            "WorkingDirectory",
+            lambda v: v is not None and "wifi-tracking" in v,
+            id="WorkingDirectory-project-root",
+        ),
+        pytest.param(
+            "ProgramArguments",
+            lambda v: bool(v) and "venv/bin/python" in v[0],
+            id="ProgramArguments-venv-python",
+        ),
+    ],
+)
+def test_plist_boot_setting(plist_data, key, check):
+    """Verify the plist settings boot auto-start and crash recovery depend on."""
+    assert check(plist_data.get(key)), f"Unexpected {key} for boot auto-start: {plist_data.get(key)!r}"
+
+
+@pytest.mark.parametrize(
+    "key",
+    ["Label", "ProgramArguments", "RunAtLoad", "KeepAlive",
+     "WorkingDirectory", "StandardOutPath", "StandardErrorPath"],
+)
+def test_plist_has_boot_required_key(plist_data, key):
     """Verify plist has all keys required for boot auto-start."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    # Critical keys for boot auto-start
-    required_keys = ["Label", "ProgramArguments", "RunAtLoad", "KeepAlive",
-                     "WorkingDirectory", "StandardOutPath", "StandardErrorPath"]
-
-    for key in required_keys:
-        assert key in plist_data, f"Plist must have {key} for boot auto-start"
-
-
-def test_plist_run_at_load_enabled():
-    """Verify RunAtLoad is enabled for automatic boot startup."""
-    import plistlib
+    assert key in plist_data, f"Plist must have {key} for boot auto-start"
 
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
 
-    assert plist_data.get("RunAtLoad") is True, \
-        "RunAtLoad must be True for boot auto-start"
+# Entry point, localhost binding (security) and port the service must run with
+@pytest.mark.parametrize("arg", ["uvicorn", "app.main:app", "127.0.0.1", "8787"])
+def test_plist_program_arguments_include(plist_data, arg):
+    """Verify ProgramArguments starts the production uvicorn server."""
+    assert arg in plist_data.get("ProgramArguments", []), f"ProgramArguments must include {arg}"
 
 
-def test_plist_keep_alive_enabled():
-    """Verify KeepAlive is enabled for crash recovery."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    assert plist_data.get("KeepAlive") is True, \
-        "KeepAlive must be True for automatic restart on crash"
-
-
-def test_log_paths_are_writable():
+@_macos_only
+def test_log_paths_are_writable(path_stat):
     """Verify log directory is writable for service logging."""
     logs_dir = Path("logs")
+    st = path_stat("logs")
 
     # Logs directory should exist
-    assert logs_dir.exists(), "logs directory must exist"
-    assert logs_dir.is_dir(), "logs must be a directory"
+    assert st is not None, "logs directory must exist"
+    assert stat.S_ISDIR(st.st_mode), "logs must be a directory"
 
     # Directory should be writable
-    import os
     assert os.access(logs_dir, os.W_OK), "logs directory must be writable"
 
 
-def test_plist_log_paths_point_to_project():
+def test_plist_log_paths_point_to_project(plist_data):
     """Verify plist log paths point to project logs directory."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
     stdout_path = plist_data.get("StandardOutPath", "")
     stderr_path = plist_data.get("StandardErrorPath", "")
 
@@ -188,25 +139,7 @@ def test_plist_log_paths_point_to_project():
     assert stderr_path.endswith("/logs/stderr.log"), "stderr should be logs/stderr.log"
 
 
-def test_service_configuration_matches_requirements():
-    """Verify service configuration matches production requirements."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
-    # Verify localhost binding (security)
-    program_args = plist_data.get("ProgramArguments", [])
-    assert "127.0.0.1" in program_args, "Must bind to localhost for security"
-
-    # Verify correct port
-    assert "8787" in program_args, "Must use port 8787"
-
-    # Verify correct app entry point
-    assert "app.main:app" in program_args, "Must use app.main:app entry point"
-
-
-def test_session_recovery_dependencies_present():
+def test_session_recovery_dependencies_present(path_stat):
     """Verify session recovery system components exist."""
     # Session manager should be importable
     try:
@@ -224,18 +157,13 @@ def test_session_recovery_dependencies_present():
         raise AssertionError(f"File store must be importable for recovery: {e}")
 
     # Data directory should exist
-    data_dir = Path("data")
-    assert data_dir.exists(), "data directory must exist for session recovery"
-    assert data_dir.is_dir(), "data must be a directory"
+    st = path_stat("data")
+    assert st is not None, "data directory must exist for session recovery"
+    assert stat.S_ISDIR(st.st_mode), "data must be a directory"
 
 
-def test_boot_startup_command_is_correct():
+def test_boot_startup_command_is_correct(plist_data):
     """Verify plist contains correct startup command structure."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
     program_args = plist_data.get("ProgramArguments", [])
 
     # Should have at least: python, -m, uvicorn, app.main:app, --host, 127.0.0.1, --port, 8787
@@ -247,15 +175,17 @@ def test_boot_startup_command_is_correct():
     assert program_args[2] == "uvicorn", "Third arg must be uvicorn"
 
 
-def test_plist_working_directory_is_absolute():
+def test_plist_working_directory_is_absolute(plist_data):
     """Verify WorkingDirectory is absolute path for boot reliability."""
-    import plistlib
-
-    with open("com.officetracker.plist", "rb") as f:
-        plist_data = plistlib.load(f)
-
     working_dir = plist_data.get("WorkingDirectory", "")
     assert working_dir.startswith("/"), \
         "WorkingDirectory must be absolute path for boot auto-start"
-    assert Path(working_dir).exists(), \
-        f"WorkingDirectory must exist: {working_dir}"
+
+
+@_macos_only
+def test_plist_working_directory_exists(plist_data, path_stat):
+    """Verify WorkingDirectory points at an existing directory on the service machine."""
+    working_dir = plist_data.get("WorkingDirectory", "")
+    st = path_stat(working_dir)
+    assert st is not None, f"WorkingDirectory must exist: {working_dir}"
+    assert stat.S_ISDIR(st.st_mode), f"WorkingDirectory must be a directory: {working_dir}"
@@ -7,111 +7,101 @@ Covers:
 - Documentation existence and quality
 """
 
+import stat
 from pathlib import Path
 
+import pytest
+
+pytestmark = pytest.mark.xdist_group(name="launchd")
+
+
+@pytest.fixture(scope="module")
+def guide_md():
+    """docs/PHASE_6_AUTO_START_GUIDE.md, read once for the documentation checks."""
+    return Path("docs/PHASE_6_AUTO_START_GUIDE.md").read_text()
+
+
+@pytest.fixture(scope="module")
+def guide_md_lower(guide_md):
+    """Lowercased guide text for the case-insensitive keyword checks."""
+    return guide_md.lower()
 
-def test_install_script_provides_user_feedback():
-    """Verify install script has helpful user feedback messages."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        content = f.read()
 
+@pytest.fixture(scope="module")
+def readme_md():
+    """README.md, read once for the quick-start checks."""
+    return Path("README.md").read_text()
+
+
+def test_install_script_provides_user_feedback(install_sh):
+    """Verify install script has helpful user feedback messages."""
     # Should have emoji/visual indicators
-    assert "✅" in content or "Installing" in content
+    assert "✅" in install_sh or "Installing" in install_sh
 
     # Should show success message
-    assert "complete" in content.lower() or "success" in content.lower()
+    assert "complete" in install_sh.lower() or "success" in install_sh.lower()
 
 
-def test_uninstall_script_provides_user_feedback():
+def test_uninstall_script_provides_user_feedback(uninstall_sh):
     """Verify uninstall script has helpful user feedback messages."""
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should have emoji/visual indicators
-    assert "✅" in content or "Uninstalling" in content
+    assert "✅" in uninstall_sh or "Uninstalling" in uninstall_sh
 
     # Should show completion message
-    assert "complete" in content.lower() or "removed" in content.lower()
+    assert "complete" in uninstall_sh.lower() or "removed" in uninstall_sh.lower()
 
 
-def test_install_script_has_error_handling():
+def test_install_script_has_error_handling(install_sh):
     """Verify install script exits on errors with set -e."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should use set -e for error handling
-    assert "set -e" in content
+    assert "set -e" in install_sh
 
 
-def test_uninstall_script_has_error_handling():
+def test_uninstall_script_has_error_handling(uninstall_sh):
     """Verify uninstall script exits on errors with set -e."""
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should use set -e for error handling
-    assert "set -e" in content
+    assert "set -e" in uninstall_sh
 
 
-def test_phase_6_documentation_exists():
+def test_phase_6_documentation_exists(path_stat):
     """Verify comprehensive Phase 6 documentation exists."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    assert doc_path.exists()
-    assert doc_path.is_file()
+    st = path_stat("docs/PHASE_6_AUTO_START_GUIDE.md")
+    assert st is not None
+    assert stat.S_ISREG(st.st_mode)
 
 
-def test_phase_6_documentation_is_substantial():
+def test_phase_6_documentation_is_substantial(guide_md):
     """Verify Phase 6 documentation is comprehensive (not just a stub)."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
-
     # Should be substantial (at least 5000 characters)
-    assert len(content) > 5000, "Documentation should be comprehensive"
-
-
-def test_phase_6_documentation_covers_installation():
-    """Verify documentation covers installation process."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
+    assert len(guide_md) > 5000, "Documentation should be comprehensive"
 
-    assert "install" in content.lower()
-    assert "installation" in content.lower() or "setup" in content.lower()
-
-
-def test_phase_6_documentation_covers_troubleshooting():
-    """Verify documentation includes troubleshooting section."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
-
-    assert "troubleshoot" in content.lower()
-
-
-def test_phase_6_documentation_covers_uninstallation():
-    """Verify documentation covers uninstallation process."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
 
-    assert "uninstall" in content.lower()
+@pytest.mark.parametrize(
+    "any_of",
+    [
+        pytest.param(("install",), id="install"),
+        pytest.param(("installation", "setup"), id="installation"),
+        pytest.param(("troubleshoot",), id="troubleshooting"),
+        pytest.param(("uninstall",), id="uninstallation"),
+    ],
+)
+def test_phase_6_documentation_covers(guide_md_lower, any_of):
+    """Verify documentation covers installation, troubleshooting and uninstallation."""
+    assert any(keyword in guide_md_lower for keyword in any_of), \
+        f"Documentation should mention one of {any_of}"
 
 
-def test_phase_6_completion_report_exists():
+def test_phase_6_completion_report_exists(path_stat):
     """Verify Phase 6 completion report exists."""
-    report_path = Path("docs/PHASE_6_COMPLETION_REPORT.md")
-    assert report_path.exists()
-    assert report_path.is_file()
+    st = path_stat("docs/PHASE_6_COMPLETION_REPORT.md")
+    assert st is not None
+    assert stat.S_ISREG(st.st_mode)
 
 
-def test_readme_documents_autostart():
+def test_readme_documents_autostart(readme_md):
     """Verify README.md includes auto-start instructions."""
-    readme_path = Path("README.md")
-    with open(readme_path, "r") as f:
-        content = f.read()
-
-    assert "auto-start" in content.lower() or "autostart" in content.lower()
-    assert "install-autostart.sh" in content
+    assert "auto-start" in readme_md.lower() or "autostart" in readme_md.lower()
+    assert "install-autostart.sh" in readme_md
 
 
 def test_action_plan_marks_phase_6_complete():
@@ -127,66 +117,50 @@ def test_action_plan_marks_phase_6_complete():
     assert "✅ DONE" in content or "[x]" in content
 
 
-def test_install_script_shows_helpful_commands():
+def test_install_script_shows_helpful_commands(install_sh):
     """Verify install script shows next-step commands to user."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should show how to check status
-    assert "launchctl" in content
+    assert "launchctl" in install_sh
 
     # Should show log locations
-    assert "logs" in content
+    assert "logs" in install_sh
 
 
-def test_scripts_directory_contains_both_scripts():
+def test_scripts_directory_contains_both_scripts(path_stat):
     """Verify scripts directory contains both install and uninstall scripts."""
-    scripts_dir = Path("scripts")
-    assert scripts_dir.exists()
+    assert path_stat("scripts") is not None
 
-    install_script = scripts_dir / "install-autostart.sh"
-    uninstall_script = scripts_dir / "uninstall-autostart.sh"
+    assert path_stat("scripts/install-autostart.sh") is not None
+    assert path_stat("scripts/uninstall-autostart.sh") is not None
 
-    assert install_script.exists()
-    assert uninstall_script.exists()
 
-
-def test_scripts_are_executable():
+def test_scripts_are_executable(path_stat):
     """Verify both scripts have execute permissions."""
-    import os
-
-    install_script = Path("scripts/install-autostart.sh")
-    uninstall_script = Path("scripts/uninstall-autostart.sh")
-
-    assert os.access(install_script, os.X_OK), "install script must be executable"
-    assert os.access(uninstall_script, os.X_OK), "uninstall script must be executable"
+    assert path_stat("scripts/install-autostart.sh").st_mode & 0o111, \
+        "install script must be executable"
+    assert path_stat("scripts/uninstall-autostart.sh").st_mode & 0o111, \
+        "uninstall script must be executable"
 
 
-def test_install_script_validates_all_prerequisites():
+def test_install_script_validates_all_prerequisites(install_sh):
     """Verify install script validates all prerequisites before installation."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should validate plist file
-    assert "plutil -lint" in content, "Must validate plist syntax"
+    assert "plutil -lint" in install_sh, "Must validate plist syntax"
 
     # Should validate venv
-    assert "venv/bin/python" in content, "Must check for virtual environment"
+    assert "venv/bin/python" in install_sh, "Must check for virtual environment"
 
     # Should validate dependencies
-    assert "import uvicorn" in content or "uvicorn" in content, "Must check for uvicorn"
+    assert "import uvicorn" in install_sh or "uvicorn" in install_sh, "Must check for uvicorn"
 
     # Should validate before copying (set -e ensures early exit on failures)
-    assert "set -e" in content, "Must use set -e for fail-fast behavior"
+    assert "set -e" in install_sh, "Must use set -e for fail-fast behavior"
 
 
-def test_uninstall_script_waits_for_launchd():
+def test_uninstall_script_waits_for_launchd(uninstall_sh, uninstall_sh_lines):
     """Verify uninstall script waits for launchd to complete unloading."""
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should wait after bootout for launchd to complete
-    lines = content.split('\n')
+    lines = uninstall_sh_lines
 
     bootout_found = False
     sleep_after_bootout = False
@@ -201,154 +175,114 @@ def test_uninstall_script_waits_for_launchd():
                 break
 
     assert bootout_found, "Must have bootout command"
-    assert sleep_after_bootout or "sleep 1" in content, "Must wait for launchd to complete"
+    assert sleep_after_bootout or "sleep 1" in uninstall_sh, "Must wait for launchd to complete"
 
 
-def test_documentation_matches_script_behavior():
+def test_documentation_matches_script_behavior(guide_md, guide_md_lower):
     """Verify documentation accurately describes script behavior."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        doc_content = f.read()
-
-    with open("scripts/install-autostart.sh", "r") as f:
-        install_content = f.read()
-
     # Doc should mention script names
-    assert "install-autostart.sh" in doc_content, "Doc must mention install script"
-    assert "uninstall-autostart.sh" in doc_content, "Doc must mention uninstall script"
+    assert "install-autostart.sh" in guide_md, "Doc must mention install script"
+    assert "uninstall-autostart.sh" in guide_md, "Doc must mention uninstall script"
 
     # Doc should mention prerequisites that script checks
-    assert "venv" in doc_content.lower() or "virtual environment" in doc_content.lower(), \
+    assert "venv" in guide_md_lower or "virtual environment" in guide_md_lower, \
         "Doc must mention venv requirement"
 
     # Doc should mention installation location
-    assert "LaunchAgents" in doc_content, "Doc must mention LaunchAgents location"
+    assert "LaunchAgents" in guide_md, "Doc must mention LaunchAgents location"
 
 
-def test_scripts_provide_clear_error_messages():
+def test_scripts_provide_clear_error_messages(install_sh):
     """Verify scripts provide clear, actionable error messages."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        install_content = f.read()
-
     # Error messages should be clear and actionable
-    assert "Error:" in install_content or "❌" in install_content, \
+    assert "Error:" in install_sh or "❌" in install_sh, \
         "Must have clear error indicators"
 
     # Should provide next steps for common errors
-    assert "Please run:" in install_content or "pip install" in install_content, \
+    assert "Please run:" in install_sh or "pip install" in install_sh, \
         "Should provide remediation steps for missing dependencies"
 
 
-def test_install_script_shows_post_install_verification():
+def test_install_script_shows_post_install_verification(install_sh):
     """Verify install script shows users how to verify installation."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should show verification commands
-    assert "launchctl list" in content, "Should show how to check service status"
-    assert "grep officetracker" in content or "com.officetracker" in content, \
+    assert "launchctl list" in install_sh, "Should show how to check service status"
+    assert "grep officetracker" in install_sh or "com.officetracker" in install_sh, \
         "Should show how to filter for this service"
 
     # Should show dashboard URL
-    assert "127.0.0.1:8787" in content or "localhost:8787" in content or "8787" in content, \
+    assert "127.0.0.1:8787" in install_sh or "localhost:8787" in install_sh or "8787" in install_sh, \
         "Should show dashboard URL"
 
 
-def test_uninstall_script_confirms_removal():
+def test_uninstall_script_confirms_removal(uninstall_sh):
     """Verify uninstall script confirms service removal."""
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        content = f.read()
-
     # Should verify service is not running after uninstall
-    assert "launchctl list" in content, "Should check service status"
+    assert "launchctl list" in uninstall_sh, "Should check service status"
 
     # Should provide clear success/failure messages
-    assert "completely removed" in content.lower() or "removed" in content.lower(), \
+    assert "completely removed" in uninstall_sh.lower() or "removed" in uninstall_sh.lower(), \
         "Should confirm successful removal"
 
 
-def test_documentation_includes_common_issues():
+def test_documentation_includes_common_issues(guide_md_lower):
     """Verify documentation covers common issues and solutions."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
-
     # Should have FAQ or common issues section
-    assert "faq" in content.lower() or "common" in content.lower() or "issue" in content.lower(), \
+    assert "faq" in guide_md_lower or "common" in guide_md_lower or "issue" in guide_md_lower, \
         "Should have FAQ or common issues section"
 
     # Should mention service status checking
-    assert "launchctl" in content.lower(), "Should explain how to check service status"
+    assert "launchctl" in guide_md_lower, "Should explain how to check service status"
 
 
-def test_scripts_handle_repeated_execution():
+def test_scripts_handle_repeated_execution(install_sh, uninstall_sh):
     """Verify scripts can be run multiple times safely."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        install_content = f.read()
-
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        uninstall_content = f.read()
-
     # Install should check if service is already running
-    assert "if launchctl list" in install_content or "grep" in install_content, \
+    assert "if launchctl list" in install_sh or "grep" in install_sh, \
         "Install should check for existing service"
 
     # Uninstall should handle already-uninstalled case
-    assert "if [ -f" in uninstall_content or "if launchctl list" in uninstall_content, \
+    assert "if [ -f" in uninstall_sh or "if launchctl list" in uninstall_sh, \
         "Uninstall should check if already uninstalled"
 
 
-def test_scripts_use_correct_paths():
+def test_scripts_use_correct_paths(install_sh, uninstall_sh):
     """Verify scripts use correct and consistent paths."""
-    with open("scripts/install-autostart.sh", "r") as f:
-        install_content = f.read()
-
-    with open("scripts/uninstall-autostart.sh", "r") as f:
-        uninstall_content = f.read()
-
     # Both should reference the same plist file name
-    assert "com.officetracker.plist" in install_content
-    assert "com.officetracker.plist" in uninstall_content
+    assert "com.officetracker.plist" in install_sh
+    assert "com.officetracker.plist" in uninstall_sh
 
     # Both should reference LaunchAgents
-    assert "LaunchAgents" in install_content
-    assert "LaunchAgents" in uninstall_content
+    assert "LaunchAgents" in install_sh
+    assert "LaunchAgents" in uninstall_sh
 
     # Should use $HOME or ~ for user home directory
-    assert "$HOME" in install_content or "~" in install_content
-    assert "$HOME" in uninstall_content or "~" in uninstall_content
+    assert "$HOME" in install_sh or "~" in install_sh
+    assert "$HOME" in uninstall_sh or "~" in uninstall_sh
 
 
-def test_documentation_structure_is_complete():
+def test_documentation_structure_is_complete(guide_md_lower):
     """Verify documentation has complete structure with all necessary sections."""
-    doc_path = Path("docs/PHASE_6_AUTO_START_GUIDE.md")
-    with open(doc_path, "r") as f:
-        content = f.read()
-
     # Should have major sections
     sections = ["installation", "uninstall", "troubleshoot", "verify"]
 
     found_sections = []
     for section in sections:
-        if section in content.lower():
+        if section in guide_md_lower:
             found_sections.append(section)
 
     assert len(found_sections) >= 3, \
         f"Documentation should have at least 3 major sections, found {len(found_sections)}: {found_sections}"
 
 
-def test_readme_provides_quick_start():
+def test_readme_provides_quick_start(readme_md):
     """Verify README provides quick-start instructions for auto-start."""
-    readme_path = Path("README.md")
-    with open(readme_path, "r") as f:
-        content = f.read()
-
     # Should mention auto-start feature
-    assert "auto" in content.lower() and "start" in content.lower(), \
+    assert "auto" in readme_md.lower() and "start" in readme_md.lower(), \
         "README must mention auto-start feature"
 
     # Should provide script command
-    assert "./scripts/install-autostart.sh" in content or \
-           "scripts/install-autostart.sh" in content or \
-           "bash scripts/install-autostart.sh" in content, \
+    assert "./scripts/install-autostart.sh" in readme_md or \
+           "scripts/install-autostart.sh" in readme_md or \
+           "bash scripts/install-autostart.sh" in readme_md, \
         "README should show how to run install script"
@@ -6,13 +6,27 @@ continued running when the app never restarted.
 """
 
 from datetime import datetime, UTC
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app import session_manager
 from app.session_manager import SessionManager
 
 
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch):
+    """
+    Pin the session manager's clock to 27-02-2026 03:00 UTC for each test.
+
+    Tests move time by assigning ``clock["now"]`` before acting.
+    """
+    holder = {"now": datetime(2026, 2, 27, 3, 0, 0, tzinfo=UTC)}
+    monkeypatch.setattr(session_manager, "now_utc", lambda: holder["now"])
+    monkeypatch.setattr(session_manager, "get_today_date_ist", lambda: "27-02-2026")
+    return holder
+
+
 @pytest.mark.asyncio
 async def test_start_session_closes_stale_session_from_previous_day():
     """
@@ -44,11 +58,8 @@ async def test_start_session_closes_stale_session_from_previous_day():
     mock_store.end_session.return_value = True
     mock_store.cancel_grace_period.return_value = True
     
-    # Mock the current date to be TODAY (27-02-2026)
-    with patch("app.session_manager.get_today_date_ist", return_value="27-02-2026"):
-        with patch("app.session_manager.now_utc", return_value=datetime(2026, 2, 27, 3, 0, 0, tzinfo=UTC)):
-            # Start session TODAY - should force-close yesterday's session first
-            result = await manager.start_session("TestOfficeWiFi")
+    # Start session TODAY (27-02-2026) - should force-close yesterday's session first
+    result = await manager.start_session("TestOfficeWiFi")
     
     # Verify the stale session was force-closed
     assert result is True
@@ -73,7 +84,7 @@ async def test_start_session_closes_stale_session_from_previous_day():
     
 
 @pytest.mark.asyncio
-async def test_start_session_no_closure_for_same_day():
+async def test_start_session_no_closure_for_same_day(clock):
     """
     When starting a session and _current_date is already TODAY,
     should NOT try to close anything.
@@ -95,11 +106,10 @@ async def test_start_session_no_closure_for_same_day():
     mock_store.start_session.return_value = MagicMock(modified_count=1)
     mock_store.cancel_grace_period.return_value = True
     
-    # Mock the current date to be TODAY (27-02-2026)
-    with patch("app.session_manager.get_today_date_ist", return_value="27-02-2026"):
-        with patch("app.session_manager.now_utc", return_value=datetime(2026, 2, 27, 3, 30, 0, tzinfo=UTC)):
-            # Start/resume session TODAY - should NOT call end_session
-            result = await manager.start_session("TestOfficeWiFi")
+    clock["now"] = datetime(2026, 2, 27, 3, 30, 0, tzinfo=UTC)
+
+    # Start/resume session TODAY (27-02-2026) - should NOT call end_session
+    result = await manager.start_session("TestOfficeWiFi")
     
     # Verify NO stale session closure happened
     assert result is True
@@ -111,20 +121,5 @@ async def test_start_session_no_closure_for_same_day():
 
 
 if __name__ == "__main__":
-    import asyncio
-    
-    print("\n" + "="*60)
-    print("TESTING STALE SESSION FIX")
-    print("="*60 + "\n")
-    
-    print("Test 1: Force-close stale session from previous day")
-    asyncio.run(test_start_session_closes_stale_session_from_previous_day())
-    print("✓ Test passed\n")
-    
-    print("Test 2: No closure for same-day session")
-    asyncio.run(test_start_session_no_closure_for_same_day())
-    print("✓ Test passed\n")
-    
-    print("="*60)
-    print("✅ ALL STALE SESSION TESTS PASSED!")
-    print("="*60)
+    # The module clock fixture patches session_manager, so run through pytest.
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -4,31 +4,39 @@ Focused tests for timer email/notification alert behavior.
 
 import asyncio
 from datetime import datetime, UTC
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 import app.timer_engine as timer_engine
-import app.timezone_utils as timezone_utils
 import app.wifi_detector as wifi_detector
 
+pytestmark = pytest.mark.xdist_group(name="timer_engine")
+
+
+_ACTIVE_DOC_TEMPLATE: dict = {
+    "date": "07-03-2026",
+    "is_active": True,
+    "has_network_access": True,
+    "current_session_start": None,
+}
+
 
 def _build_active_doc(
     *,
     total_minutes: int,
     completed_4h: bool,
-    pre_leave_email_sent_at=None,
-    completion_email_sent_at=None,
-    completion_desktop_sent_at=None,
     start_utc: datetime | None = None,
+    pre_leave_email_sent_at: datetime | None = None,
+    completion_email_sent_at: datetime | None = None,
+    completion_desktop_sent_at: datetime | None = None,
 ) -> dict:
+    """Build an active-session doc: the fixed template fields plus the per-test ones."""
     return {
-        "date": "07-03-2026",
-        "is_active": True,
-        "has_network_access": True,
-        "completed_4h": completed_4h,
+        **_ACTIVE_DOC_TEMPLATE,
         "total_minutes": total_minutes,
-        "current_session_start": None,
+        "completed_4h": completed_4h,
         "first_session_start_utc": start_utc,
         "pre_leave_email_sent_at": pre_leave_email_sent_at,
         "completion_email_sent_at": completion_email_sent_at,
@@ -36,23 +44,39 @@ def _build_active_doc(
     }
 
 
+def _build_store() -> SimpleNamespace:
+    """Build a minimal MongoDB store stand-in exposing only what the timer loop awaits."""
+    return SimpleNamespace(
+        update_elapsed_time=AsyncMock(return_value=False),
+        end_session=AsyncMock(),
+        mark_completed=AsyncMock(),
+        mark_pre_leave_email_sent=AsyncMock(return_value=True),
+        mark_completion_email_sent=AsyncMock(return_value=True),
+        mark_completion_desktop_sent=AsyncMock(return_value=True),
+    )
+
+
 async def _run_timer_for_iterations(
     monkeypatch: pytest.MonkeyPatch,
     *,
-    store: object,
+    store: SimpleNamespace,
     docs: list[dict],
     target_minutes: int,
     email_sender: MagicMock,
     desktop_sender: MagicMock,
 ) -> None:
     get_active_session = AsyncMock(side_effect=docs)
-    setattr(store, "get_active_session", get_active_session)
+    store.get_active_session = get_active_session
 
     monkeypatch.setattr(timer_engine, "get_mongo_store", lambda: store)
     monkeypatch.setattr(timer_engine, "_resolve_target_minutes", lambda: target_minutes)
     monkeypatch.setattr(timer_engine, "send_email_notification", email_sender)
-    monkeypatch.setattr(timer_engine, "send_notification", desktop_sender)
-    monkeypatch.setattr(timezone_utils, "get_today_date_ist", lambda: "07-03-2026")
+
+    async def _fake_desktop_sender(title, message):
+        return desktop_sender(title, message)
+
+    monkeypatch.setattr(timer_engine, "send_notification_async", _fake_desktop_sender)
+    monkeypatch.setattr(timer_engine, "get_today_date_ist", lambda: "07-03-2026")
     monkeypatch.setattr(wifi_detector, "get_current_ssid", lambda use_cache=True: "OfficeWiFi")
     monkeypatch.setattr(wifi_detector, "is_office_ssid", lambda ssid: True)
 
@@ -77,13 +101,7 @@ async def _run_timer_for_iterations(
 async def test_pre_alert_email_sent_once_when_remaining_is_10(monkeypatch: pytest.MonkeyPatch) -> None:
     """Sends exactly one pre-leave email inside the <=10 minute window."""
     start_utc = datetime(2026, 3, 7, 4, 0, 0, tzinfo=UTC)
-    store = MagicMock()
-    store.update_elapsed_time = AsyncMock(return_value=False)
-    store.end_session = AsyncMock()
-    store.mark_completed = AsyncMock()
-    store.mark_pre_leave_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_desktop_sent = AsyncMock(return_value=True)
+    store = _build_store()
 
     docs = [
         _build_active_doc(
@@ -121,13 +139,7 @@ async def test_pre_alert_email_sent_once_when_remaining_is_10(monkeypatch: pytes
 @pytest.mark.asyncio
 async def test_pre_alert_not_sent_outside_window(monkeypatch: pytest.MonkeyPatch) -> None:
     """Does not send pre-alert when remaining time is above 10 minutes."""
-    store = MagicMock()
-    store.update_elapsed_time = AsyncMock(return_value=False)
-    store.end_session = AsyncMock()
-    store.mark_completed = AsyncMock()
-    store.mark_pre_leave_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_desktop_sent = AsyncMock(return_value=True)
+    store = _build_store()
 
     docs = [_build_active_doc(total_minutes=239, completed_4h=False)]
     email_sender = MagicMock(return_value=True)
@@ -150,13 +162,7 @@ async def test_pre_alert_not_sent_outside_window(monkeypatch: pytest.MonkeyPatch
 @pytest.mark.asyncio
 async def test_completion_sends_email_and_desktop(monkeypatch: pytest.MonkeyPatch) -> None:
     """At completion threshold, send completion email + desktop and persist sent flags."""
-    store = MagicMock()
-    store.update_elapsed_time = AsyncMock(return_value=False)
-    store.end_session = AsyncMock()
-    store.mark_completed = AsyncMock()
-    store.mark_pre_leave_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_desktop_sent = AsyncMock(return_value=True)
+    store = _build_store()
 
     docs = [_build_active_doc(total_minutes=250, completed_4h=False)]
     email_sender = MagicMock(return_value=True)
@@ -189,13 +195,7 @@ async def test_completion_sends_email_and_desktop(monkeypatch: pytest.MonkeyPatc
 async def test_completion_not_resent_when_sent_flags_exist(monkeypatch: pytest.MonkeyPatch) -> None:
     """Restart-safe: when sent flags exist, no duplicate completion alerts are sent."""
     sent_at = datetime(2026, 3, 7, 10, 0, 0, tzinfo=UTC)
-    store = MagicMock()
-    store.update_elapsed_time = AsyncMock(return_value=False)
-    store.end_session = AsyncMock()
-    store.mark_completed = AsyncMock()
-    store.mark_pre_leave_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_desktop_sent = AsyncMock(return_value=True)
+    store = _build_store()
 
     docs = [
         _build_active_doc(
@@ -227,13 +227,7 @@ async def test_completion_not_resent_when_sent_flags_exist(monkeypatch: pytest.M
 async def test_completion_retries_only_unsent_channel(monkeypatch: pytest.MonkeyPatch) -> None:
     """If one completion channel already sent, retry only the unsent channel."""
     sent_at = datetime(2026, 3, 7, 10, 0, 0, tzinfo=UTC)
-    store = MagicMock()
-    store.update_elapsed_time = AsyncMock(return_value=False)
-    store.end_session = AsyncMock()
-    store.mark_completed = AsyncMock()
-    store.mark_pre_leave_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_email_sent = AsyncMock(return_value=True)
-    store.mark_completion_desktop_sent = AsyncMock(return_value=True)
+    store = _build_store()
 
     docs = [
         _build_active_doc(total_minutes=260, completed_4h=True),